@@ -99,13 +99,17 @@ class Settings(BaseSettings):
         default=1_048_576,  # 1 MB
         description="Maximum webhook request body size in bytes",
     )
+    webhook_history_max_payload_size: int = Field(
+        default=65_536,  # 64 KB
+        description="Largest webhook body in bytes kept in full in webhook history; larger ones are summarized (0 keeps everything)",
+    )
     use_unix_socket: bool = Field(
         default=is_unix_socket_supported(),
         description="Use Unix domain socket instead of TCP/IP port (Unix-like systems only)",
     )
     socket_dir: Optional[str] = Field(
         default=None,
-        description="Directory for Unix domain socket (default: system temp directory)",
+        description="Directory for Unix domain socket (default: XDG_RUNTIME_DIR, else system temp directory)",
     )
 
     # Ngrok settings
@@ -23,6 +23,7 @@ from .utils.logger import get_logger
 from .webhook import (
     start_webhook_handler,
     stop_webhook_handler,
+    webhook_handler,
 )
 
 def parse_args(args=None) -> argparse.Namespace:
@@ -263,25 +264,14 @@ def setup_webhook_server(args: argparse.Namespace) -> None:
 
             try:
                 logger.info("Cleaning up existing ngrok SDK resources...")
-                ngrok.disconnect()
-                time.sleep(1)  # Brief pause to allow cleanup
+                # Same teardown the handler uses between reconnects; it
+                # returns once closed, so there is nothing to wait for
+                webhook_handler._teardown()
             except Exception as cleanup_err:
                 logger.warning(
                     f"NGrok cleanup warning (non-fatal): {cleanup_err}"
                 )
 
-            # Force disable any custom domain in NGrok config
-            if settings.ngrok_enabled and hasattr(ngrok, "set_config"):
-                try:
-                    ngrok.set_config(domain=None)
-                    logger.info(
-                        "Explicitly disabled custom domain in NGrok configuration"
-                    )
-                except Exception as config_err:
-                    logger.warning(
-                        f"Could not override NGrok domain config: {config_err}"
-                    )
-
             # Check for existing sessions and warn (but don't kill them)
             if os.name == "posix" and hasattr(ngrok, "list_tunnels"):
                 try:
@@ -440,7 +430,8 @@ def signal_handler(sig, frame) -> None:
     """Handle termination signals."""
     logger.info(f"Received signal {sig}, shutting down...")
     cleanup_webhook_server()
-    sys.exit(0)
+    # The tunnel monitor raises SIGTERM itself on unrecoverable errors
+    sys.exit(1 if webhook_handler.fatal_error else 0)
 
 
 def run_server() -> None:
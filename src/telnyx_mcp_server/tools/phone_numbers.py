@@ -6,14 +6,12 @@ from pydantic import Field
 
 from ..mcp import mcp
 from ..telnyx.services.numbers import NumbersService
-from ..utils.error_handler import handle_telnyx_error
-from ..utils.logger import get_logger
+from ..utils.error_handler import telnyx_tool
 from ..utils.service import get_authenticated_service
 
-logger = get_logger(__name__)
-
 
 @mcp.tool()
+@telnyx_tool("listing phone numbers")
 async def list_phone_numbers(request: Dict[str, Any]) -> Dict[str, Any]:
     """List phone numbers.
 
@@ -28,15 +26,12 @@ async def list_phone_numbers(request: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Response data
     """
-    try:
-        service = get_authenticated_service(NumbersService)
-        return service.list_phone_numbers(**request)
-    except Exception as e:
-        logger.error(f"Error listing phone numbers: {e}")
-        raise handle_telnyx_error(e)
+    service = get_authenticated_service(NumbersService)
+    return service.list_phone_numbers(**request)
 
 
 @mcp.tool()
+@telnyx_tool("getting phone number")
 async def get_phone_number(
     id: str = Field(..., description="Phone number ID as string"),
 ) -> Dict[str, Any]:
@@ -48,15 +43,12 @@ async def get_phone_number(
     Returns:
         Dict[str, Any]: Response data containing Number Object(s) (record_type: "phone_number")
     """
-    try:
-        service = get_authenticated_service(NumbersService)
-        return service.get_phone_number(id=id)
-    except Exception as e:
-        logger.error(f"Error getting phone number: {e}")
-        raise handle_telnyx_error(e)
+    service = get_authenticated_service(NumbersService)
+    return service.get_phone_number(id=id)
 
 
 @mcp.tool()
+@telnyx_tool("updating phone number")
 async def update_phone_number(
     id: str, request: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -70,15 +62,12 @@ async def update_phone_number(
     Returns:
         Dict[str, Any]: Response data
     """
-    try:
-        service = get_authenticated_service(NumbersService)
-        return service.update_phone_number(id=id, data=request)
-    except Exception as e:
-        logger.error(f"Error updating phone number: {e}")
-        raise handle_telnyx_error(e)
+    service = get_authenticated_service(NumbersService)
+    return service.update_phone_number(id=id, data=request)
 
 
 @mcp.tool()
+@telnyx_tool("listing available phone numbers")
 async def list_available_phone_numbers(
     request: Dict[str, Any],
 ) -> Dict[str, Any]:
@@ -98,27 +87,22 @@ async def list_available_phone_numbers(
     Returns:
         Dict[str, Any]: Response data
     """
-    try:
-        service = get_authenticated_service(NumbersService)
-        filter_params = {
-            key: value
-            for key, value in request.items()
-            if key.startswith("filter_")
-        }
-        base_params = {
-            key: value
-            for key, value in request.items()
-            if not key.startswith("filter_")
-        }
-        return service.list_available_phone_numbers(
-            **base_params, **filter_params
-        )
-    except Exception as e:
-        logger.error(f"Error listing available phone numbers: {e}")
-        raise handle_telnyx_error(e)
+    service = get_authenticated_service(NumbersService)
+    filter_params = {
+        key: value
+        for key, value in request.items()
+        if key.startswith("filter_")
+    }
+    base_params = {
+        key: value
+        for key, value in request.items()
+        if not key.startswith("filter_")
+    }
+    return service.list_available_phone_numbers(**base_params, **filter_params)
 
 
 @mcp.tool()
+@telnyx_tool("buying phone number")
 async def initiate_phone_number_order(
     request: Dict[str, Any],
 ) -> Dict[str, Any]:
@@ -131,15 +115,12 @@ async def initiate_phone_number_order(
     Returns:
         Dict[str, Any]: Response data
     """
-    try:
-        service = get_authenticated_service(NumbersService)
-        return service.buy_phone_number(**request)
-    except Exception as e:
-        logger.error(f"Error buying phone number: {e}")
-        raise handle_telnyx_error(e)
+    service = get_authenticated_service(NumbersService)
+    return service.buy_phone_number(**request)
 
 
 @mcp.tool()
+@telnyx_tool("updating phone number messaging settings")
 async def update_phone_number_messaging_settings(
     id: str, request: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -153,9 +134,5 @@ async def update_phone_number_messaging_settings(
     Returns:
         Dict[str, Any]: Response data
     """
-    try:
-        service = get_authenticated_service(NumbersService)
-        return service.update_phone_number_messaging_settings(id=id, **request)
-    except Exception as e:
-        logger.error(f"Error updating phone number messaging settings: {e}")
-        raise handle_telnyx_error(e)
+    service = get_authenticated_service(NumbersService)
+    return service.update_phone_number_messaging_settings(id=id, **request)
@@ -6,14 +6,12 @@ from pydantic import Field
 
 from ..mcp import mcp
 from ..telnyx.services.secrets import SecretsService
-from ..utils.error_handler import handle_telnyx_error
-from ..utils.logger import get_logger
+from ..utils.error_handler import telnyx_tool
 from ..utils.service import get_authenticated_service
 
-logger = get_logger(__name__)
-
 
 @mcp.tool()
+@telnyx_tool("listing integration secrets")
 async def list_integration_secrets(request: Dict[str, Any]) -> Dict[str, Any]:
     """List integration secrets.
 
@@ -25,15 +23,12 @@ async def list_integration_secrets(request: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Response data containing Integration Secret Object(s) (record_type: "integration_secret")
     """
-    try:
-        service = get_authenticated_service(SecretsService)
-        return service.list_integration_secrets(request)
-    except Exception as e:
-        logger.error(f"Error listing integration secrets: {e}")
-        raise handle_telnyx_error(e)
+    service = get_authenticated_service(SecretsService)
+    return service.list_integration_secrets(**request)
 
 
 @mcp.tool()
+@telnyx_tool("creating integration secret")
 async def create_integration_secret(request: Dict[str, Any]) -> Dict[str, Any]:
     """Create an integration secret.
 
@@ -47,15 +42,12 @@ async def create_integration_secret(request: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Response data containing the created Integration Secret Object (record_type: "integration_secret")
     """
-    try:
-        service = get_authenticated_service(SecretsService)
-        return service.create_integration_secret(request)
-    except Exception as e:
-        logger.error(f"Error creating integration secret: {e}")
-        raise handle_telnyx_error(e)
+    service = get_authenticated_service(SecretsService)
+    return service.create_integration_secret(request)
 
 
 @mcp.tool()
+@telnyx_tool("deleting integration secret")
 async def delete_integration_secret(
     id: str = Field(..., description="Secret ID as string"),
 ) -> Dict[str, Any]:
@@ -67,9 +59,5 @@ async def delete_integration_secret(
     Returns:
         Dict[str, Any]: Empty response on success
     """
-    try:
-        service = get_authenticated_service(SecretsService)
-        return service.delete_integration_secret(id=id)
-    except Exception as e:
-        logger.error(f"Error deleting integration secret: {e}")
-        raise handle_telnyx_error(e)
+    service = get_authenticated_service(SecretsService)
+    return service.delete_integration_secret(id=id)
@@ -2,24 +2,236 @@
 
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Hashable, Optional, Tuple
 
 from ..mcp import mcp
 from ..utils.logger import get_logger
 from ..webhook import get_webhook_history
+from ..webhook.server import webhook_history
 
 logger = get_logger(__name__)
 
 # Resource URI for SMS conversations
 SMS_CONVERSATIONS_URI = "resource://sms/conversations"
 
+# Number of parsed webhook events kept cached before stale ones are
+# dropped; events beyond the webhook history can never be read again
+MAX_PARSED_EVENTS = webhook_history.maxlen
+
+# Parsed message (or None) per webhook event ID
+_parsed_events: Dict[Hashable, Any] = {}
+
+
+def _event_id(event: Dict[str, Any]) -> Optional[Hashable]:
+    """Return a key identifying the webhook event behind a history entry.
+
+    Telnyx gives every event an ID (``data.id``) that is kept across
+    redeliveries, so it is preferred over the time the entry was
+    received. Returns None if the entry cannot be identified.
+    """
+    payload = event.get("payload")
+    if isinstance(payload, dict):
+        data = payload.get("data")
+        if isinstance(data, dict) and data.get("id"):
+            return data["id"]
+    summary = event.get("payload_summary")
+    if isinstance(summary, dict) and summary.get("id"):
+        return summary["id"]
+    timestamp = event.get("timestamp")
+    if timestamp:
+        return (event.get("event_type", ""), timestamp)
+    return None
+
+
+def _parse_message_event(
+    event: Dict[str, Any],
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Parse a single webhook event into an SMS message.
+
+    Args:
+        event: Webhook event
+
+    Returns:
+        Tuple of (conversation ID, message), or None if the event is not an
+        SMS event or its participants cannot be identified
+    """
+    # Check if this is an SMS-related event
+    event_type = event.get("event_type", "")
+    payload = event.get("payload", {})
+
+    if "message" not in event_type.lower() and "sms" not in event_type.lower():
+        return None
+
+    try:
+        # Handle Telnyx webhook structure which has nested payload
+        data_payload = None
+
+        # First try to navigate through the Telnyx webhook structure
+        if payload and "data" in payload:
+            data = payload["data"]
+            if "payload" in data:
+                data_payload = data["payload"]
+
+        # If we found the proper payload structure, use it
+        if data_payload:
+            # Extract from phone number
+            from_info = data_payload.get("from", {})
+            from_number = None
+            if isinstance(from_info, dict) and "phone_number" in from_info:
+                from_number = from_info["phone_number"]
+            elif isinstance(from_info, str):
+                from_number = from_info
+
+            # Extract to phone number
+            to_info = data_payload.get("to", [])
+            to_number = None
+            if isinstance(to_info, list) and len(to_info) > 0:
+                first_to = to_info[0]
+                if isinstance(first_to, dict) and "phone_number" in first_to:
+                    to_number = first_to["phone_number"]
+            elif isinstance(to_info, dict) and "phone_number" in to_info:
+                to_number = to_info["phone_number"]
+            elif isinstance(to_info, str):
+                to_number = to_info
+
+            # Get message text
+            message_text = data_payload.get("text", "")
+
+            # Extract direction and timestamp
+            direction = data_payload.get("direction", "")
+
+            # Try different timestamp fields
+            message_time = None
+            timestamp_fields = [
+                "received_at",
+                "sent_at",
+                "completed_at",
+                "timestamp",
+            ]
+            for field in timestamp_fields:
+                if field in data_payload and data_payload[field]:
+                    message_time = data_payload[field]
+                    break
+
+            if not message_time:
+                occurred_at = data.get("occurred_at")
+                if occurred_at:
+                    message_time = occurred_at
+                else:
+                    message_time = event.get(
+                        "timestamp", datetime.now().isoformat()
+                    )
+        else:
+            # Fallback to simpler webhook format
+            # Extract message details from payload
+            data = payload.get("data", payload)
+
+            # Extract message details
+            from_number = None
+            from_info = data.get("from", {})
+            if isinstance(from_info, dict) and "phone_number" in from_info:
+                from_number = from_info["phone_number"]
+            elif isinstance(from_info, str):
+                from_number = from_info
+
+            to_number = None
+            # Handle different payload structures
+            to_info = data.get("to", [])
+            if isinstance(to_info, list) and len(to_info) > 0:
+                first_to = to_info[0]
+                if isinstance(first_to, dict) and "phone_number" in first_to:
+                    to_number = first_to["phone_number"]
+            elif isinstance(to_info, dict) and "phone_number" in to_info:
+                to_number = to_info["phone_number"]
+            elif isinstance(to_info, str):
+                to_number = to_info
+
+            # Extract message content
+            message_text = data.get("text", "")
+
+            # Try different timestamp fields based on webhook format
+            timestamp_fields = [
+                "timestamp",
+                "received_at",
+                "sent_at",
+                "created_at",
+                "updated_at",
+            ]
+            message_time = None
+            for field in timestamp_fields:
+                if field in data and data[field]:
+                    message_time = data[field]
+                    break
+
+            if not message_time:
+                message_time = event.get(
+                    "timestamp", datetime.now().isoformat()
+                )
+
+            # Determine direction
+            direction = data.get("direction", "")
+
+        # Skip if we can't identify the numbers
+        if not from_number or not to_number:
+            logger.warning(
+                f"Could not identify from or to number in event: {event_type}"
+            )
+            return None
+
+        # Create a unique conversation ID (sort numbers to ensure consistency)
+        conv_participants = sorted([from_number, to_number])
+        conversation_id = f"{conv_participants[0]}:{conv_participants[1]}"
+
+        # Determine direction if not already set
+        if not direction:
+            if "outbound" in event_type.lower():
+                direction = "outbound"
+            elif (
+                "inbound" in event_type.lower()
+                or "received" in event_type.lower()
+            ):
+                direction = "inbound"
+            else:
+                direction = "unknown"
+
+        # Get message ID if available
+        message_id = None
+        if data_payload and "id" in data_payload:
+            message_id = data_payload["id"]
+        elif "id" in data:
+            message_id = data["id"]
+
+        # Create message object
+        message = {
+            "id": message_id,
+            "from": from_number,
+            "to": to_number,
+            "text": message_text,
+            "timestamp": message_time,
+            "direction": direction,
+            "event_type": event_type,
+        }
+
+        # Log the extracted message for debugging
+        logger.debug(
+            f"Extracted message: {from_number} -> {to_number}: '{message_text}'"
+        )
+
+        return conversation_id, message
+    except Exception as e:
+        logger.error(f"Error processing message event: {e}")
+        return None
+
 
 def _extract_conversation_details(webhook_events):
     """
     Extract SMS conversation details from webhook events.
 
     This function organizes SMS events into conversations based on phone numbers.
-    It tracks messages between the same pair of numbers.
+    It tracks messages between the same pair of numbers. Each event is parsed
+    only once; repeated reads of the same events reuse the cached result, and
+    duplicate events in the input are counted once.
 
     Args:
         webhook_events: List of webhook events
@@ -38,200 +250,45 @@ def _extract_conversation_details(webhook_events):
     )
 
     # Process all webhook events
+    seen_event_ids = set()
     for event in webhook_events:
-        # Check if this is an SMS-related event
-        event_type = event.get("event_type", "")
-        payload = event.get("payload", {})
-
-        if "message" in event_type.lower() or "sms" in event_type.lower():
-            try:
-                # Handle Telnyx webhook structure which has nested payload
-                data_payload = None
-
-                # First try to navigate through the Telnyx webhook structure
-                if payload and "data" in payload:
-                    data = payload["data"]
-                    if "payload" in data:
-                        data_payload = data["payload"]
-
-                # If we found the proper payload structure, use it
-                if data_payload:
-                    # Extract from phone number
-                    from_info = data_payload.get("from", {})
-                    from_number = None
-                    if (
-                        isinstance(from_info, dict)
-                        and "phone_number" in from_info
-                    ):
-                        from_number = from_info["phone_number"]
-                    elif isinstance(from_info, str):
-                        from_number = from_info
-
-                    # Extract to phone number
-                    to_info = data_payload.get("to", [])
-                    to_number = None
-                    if isinstance(to_info, list) and len(to_info) > 0:
-                        first_to = to_info[0]
-                        if (
-                            isinstance(first_to, dict)
-                            and "phone_number" in first_to
-                        ):
-                            to_number = first_to["phone_number"]
-                    elif (
-                        isinstance(to_info, dict) and "phone_number" in to_info
-                    ):
-                        to_number = to_info["phone_number"]
-                    elif isinstance(to_info, str):
-                        to_number = to_info
-
-                    # Get message text
-                    message_text = data_payload.get("text", "")
-
-                    # Extract direction and timestamp
-                    direction = data_payload.get("direction", "")
-
-                    # Try different timestamp fields
-                    message_time = None
-                    timestamp_fields = [
-                        "received_at",
-                        "sent_at",
-                        "completed_at",
-                        "timestamp",
-                    ]
-                    for field in timestamp_fields:
-                        if field in data_payload and data_payload[field]:
-                            message_time = data_payload[field]
-                            break
-
-                    if not message_time:
-                        occurred_at = data.get("occurred_at")
-                        if occurred_at:
-                            message_time = occurred_at
-                        else:
-                            message_time = event.get(
-                                "timestamp", datetime.now().isoformat()
-                            )
-                else:
-                    # Fallback to simpler webhook format
-                    # Extract message details from payload
-                    data = payload.get("data", payload)
-
-                    # Extract message details
-                    from_number = None
-                    from_info = data.get("from", {})
-                    if (
-                        isinstance(from_info, dict)
-                        and "phone_number" in from_info
-                    ):
-                        from_number = from_info["phone_number"]
-                    elif isinstance(from_info, str):
-                        from_number = from_info
-
-                    to_number = None
-                    # Handle different payload structures
-                    to_info = data.get("to", [])
-                    if isinstance(to_info, list) and len(to_info) > 0:
-                        first_to = to_info[0]
-                        if (
-                            isinstance(first_to, dict)
-                            and "phone_number" in first_to
-                        ):
-                            to_number = first_to["phone_number"]
-                    elif (
-                        isinstance(to_info, dict) and "phone_number" in to_info
-                    ):
-                        to_number = to_info["phone_number"]
-                    elif isinstance(to_info, str):
-                        to_number = to_info
-
-                    # Extract message content
-                    message_text = data.get("text", "")
-
-                    # Try different timestamp fields based on webhook format
-                    timestamp_fields = [
-                        "timestamp",
-                        "received_at",
-                        "sent_at",
-                        "created_at",
-                        "updated_at",
-                    ]
-                    message_time = None
-                    for field in timestamp_fields:
-                        if field in data and data[field]:
-                            message_time = data[field]
-                            break
-
-                    if not message_time:
-                        message_time = event.get(
-                            "timestamp", datetime.now().isoformat()
-                        )
-
-                    # Determine direction
-                    direction = data.get("direction", "")
-
-                # Skip if we can't identify the numbers
-                if not from_number or not to_number:
-                    logger.warning(
-                        f"Could not identify from or to number in event: {event_type}"
-                    )
-                    continue
-
-                # Create a unique conversation ID (sort numbers to ensure consistency)
-                conv_participants = sorted([from_number, to_number])
-                conversation_id = (
-                    f"{conv_participants[0]}:{conv_participants[1]}"
-                )
-
-                # Determine direction if not already set
-                if not direction:
-                    if "outbound" in event_type.lower():
-                        direction = "outbound"
-                    elif (
-                        "inbound" in event_type.lower()
-                        or "received" in event_type.lower()
-                    ):
-                        direction = "inbound"
-                    else:
-                        direction = "unknown"
-
-                # Get message ID if available
-                message_id = None
-                if data_payload and "id" in data_payload:
-                    message_id = data_payload["id"]
-                elif "id" in data:
-                    message_id = data["id"]
-
-                # Create message object
-                message = {
-                    "id": message_id,
-                    "from": from_number,
-                    "to": to_number,
-                    "text": message_text,
-                    "timestamp": message_time,
-                    "direction": direction,
-                    "event_type": event_type,
-                }
-
-                # Log the extracted message for debugging
-                logger.debug(
-                    f"Extracted message: {from_number} -> {to_number}: '{message_text}'"
-                )
-
-                # Add/update conversation details
-                conversations[conversation_id]["messages"].append(message)
-                conversations[conversation_id]["participants"].add(from_number)
-                conversations[conversation_id]["participants"].add(to_number)
-
-                # Update timestamps
-                if not conversations[conversation_id]["started_at"]:
-                    conversations[conversation_id]["started_at"] = message_time
-
-                conversations[conversation_id]["last_message_time"] = (
-                    message_time
-                )
-            except Exception as e:
-                logger.error(f"Error processing message event: {e}")
-                continue
+        event_id = _event_id(event)
+        if event_id is None:
+            # Can't be recognized again, so parse it without caching
+            parsed = _parse_message_event(event)
+        elif event_id in seen_event_ids:
+            continue
+        else:
+            seen_event_ids.add(event_id)
+            if event_id in _parsed_events:
+                parsed = _parsed_events[event_id]
+            else:
+                parsed = _parse_message_event(event)
+                _parsed_events[event_id] = parsed
+
+        if parsed is None:
+            continue
+
+        conversation_id, message = parsed
+        from_number = message["from"]
+        to_number = message["to"]
+        message_time = message["timestamp"]
+
+        # Add/update conversation details
+        conversations[conversation_id]["messages"].append(message)
+        conversations[conversation_id]["participants"].add(from_number)
+        conversations[conversation_id]["participants"].add(to_number)
+
+        # Update timestamps
+        if not conversations[conversation_id]["started_at"]:
+            conversations[conversation_id]["started_at"] = message_time
+
+        conversations[conversation_id]["last_message_time"] = message_time
+
+    # Forget events that have dropped out of the webhook history
+    if len(_parsed_events) > MAX_PARSED_EVENTS:
+        for stale_id in _parsed_events.keys() - seen_event_ids:
+            del _parsed_events[stale_id]
 
     # Convert to list of conversations
     result = []
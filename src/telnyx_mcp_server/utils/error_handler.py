@@ -1,11 +1,17 @@
 """Error handling utilities."""
 
+import functools
+import inspect
+from typing import Any, Callable, TypeVar
+
 import requests
 
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+F = TypeVar("F", bound=Callable[..., Any])
+
 
 def handle_telnyx_error(error: Exception) -> Exception:
     """Handle Telnyx API errors.
@@ -28,3 +34,44 @@ def handle_telnyx_error(error: Exception) -> Exception:
         except Exception:
             pass
     return error
+
+
+def telnyx_tool(op_name: str) -> Callable[[F], F]:
+    """Log and translate errors raised by a tool function.
+
+    Works for both sync and async callables. The wrapped function keeps its
+    name, docstring and signature so it can still be registered with
+    ``mcp.tool()``.
+
+    Args:
+        op_name: Description of the operation, used in the error log
+            (e.g. "listing phone numbers")
+
+    Returns:
+        Callable: Decorator
+    """
+
+    def decorator(fn: F) -> F:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"Error {op_name}: {e}")
+                    raise handle_telnyx_error(e)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Error {op_name}: {e}")
+                raise handle_telnyx_error(e)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
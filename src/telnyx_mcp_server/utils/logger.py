@@ -1,11 +1,145 @@
 """Logging utilities."""
 
+import atexit
 import logging
+import logging.handlers
 import sys
-from typing import Optional
+import threading
+import time
+from typing import List, Optional, Set, Tuple
 
 from ..config import settings
 
+# Numeric log level, resolved once from settings
+_LEVEL = getattr(logging, settings.log_level)
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each second's ``asctime`` only once.
+
+    Bursts of records mostly fall within the same second, so the
+    ``strftime`` result is kept in a single slot and only the
+    milliseconds are formatted per record.
+    """
+
+    _cached_time: Tuple[int, str] = (-1, "")
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+
+        sec = int(record.created)
+        cached_sec, cached_str = self._cached_time
+        if sec != cached_sec:
+            cached_str = time.strftime(
+                self.default_time_format, self.converter(sec)
+            )
+            # One tuple assignment keeps the slot consistent across threads
+            self._cached_time = (sec, cached_str)
+        return self.default_msec_format % (cached_str, record.msecs)
+
+
+# Shared formatter for all console handlers
+_FORMATTER = _CachedTimeFormatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+
+class _StderrHandler(logging.StreamHandler):
+    """Stream handler that emits each record with a single write.
+
+    ``sys.stderr`` is line-buffered (Python 3.9+), so the trailing
+    terminator flushes the record without a separate ``flush()`` call.
+    The stream is looked up on every emit, since buffered records may be
+    written after ``sys.stderr`` has been replaced.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(sys.stderr)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            sys.stderr.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """Write all records at or above this handler's level at once."""
+        try:
+            text = "".join(
+                self.format(record) + self.terminator
+                for record in records
+                if record.levelno >= self.level
+            )
+            if text:
+                sys.stderr.write(text)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(records[-1])
+
+
+class _BatchingMemoryHandler(logging.handlers.MemoryHandler):
+    """Memory handler that writes its buffered records in one batch."""
+
+    def flush(self) -> None:
+        with self.lock:
+            if self.buffer and self.target:
+                self.target.emit_batch(self.buffer)
+                self.buffer.clear()
+
+
+def _build_console_handler() -> _BatchingMemoryHandler:
+    """Build the console handler shared by all loggers.
+
+    Records are buffered in memory and written to stderr in batches: when
+    the buffer fills, when a record of level WARNING or above arrives,
+    every ``_FLUSH_INTERVAL`` seconds, and at exit. Each batch is a single
+    write, and buffered records reach stderr at most that long after they
+    were logged.
+    """
+    stream_handler = _StderrHandler()
+    stream_handler.setLevel(_LEVEL)
+    stream_handler.setFormatter(_FORMATTER)
+
+    memory_handler = _BatchingMemoryHandler(
+        capacity=512,
+        flushLevel=logging.WARNING,
+        target=stream_handler,
+        flushOnClose=True,
+    )
+    memory_handler.setLevel(_LEVEL)
+    return memory_handler
+
+
+def _periodic_flush() -> None:
+    """Background thread: flush buffered log records periodically."""
+    while not _flush_stop.wait(_FLUSH_INTERVAL):
+        _console_handler.flush()
+
+
+def _close_console_handler() -> None:
+    """Stop the flush thread and write out any buffered records."""
+    _flush_stop.set()
+    _console_handler.close()
+
+
+# Seconds between periodic flushes of buffered log records
+_FLUSH_INTERVAL = 1.0
+
+_console_handler = _build_console_handler()
+_flush_stop = threading.Event()
+threading.Thread(target=_periodic_flush, name="log-flush", daemon=True).start()
+atexit.register(_close_console_handler)
+
+# Names of loggers that already have a console handler attached
+_configured: Set[Optional[str]] = set()
+_configure_lock = threading.Lock()
+
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Get a logger.
@@ -17,16 +151,17 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
         logging.Logger: Logger
     """
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, settings.log_level))
-
-    # Add console handler if not already added
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stderr)
-        handler.setLevel(getattr(logging, settings.log_level))
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+    if name in _configured:
+        return logger
+
+    with _configure_lock:
+        if name not in _configured:
+            logger.setLevel(_LEVEL)
+
+            # Add console handler if not already added
+            if not logger.handlers:
+                logger.addHandler(_console_handler)
+
+            _configured.add(name)
 
     return logger
@@ -1,7 +1,10 @@
 """Service utilities."""
 
+import logging
 from typing import Any, Type
 
+# Use the client from mcp.py that's already initialized with API key
+from ..mcp import telnyx_client
 from .logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,16 +21,13 @@ def get_authenticated_service(service_cls: Type[Any]) -> Any:
     """
     logger.info(f"Getting authenticated service for {service_cls.__name__}")
 
-    # Use the client from mcp.py that's already initialized with API key
-    from ..mcp import telnyx_client
-
     # Log masked API key at debug level
-    if hasattr(telnyx_client, "api_key") and telnyx_client.api_key:
-        masked_key = (
-            f"{telnyx_client.api_key[:5]}..."
-            if len(telnyx_client.api_key) > 5
-            else "[REDACTED]"
-        )
-        logger.debug(f"Using client with API key: {masked_key}")
+    if logger.isEnabledFor(logging.DEBUG):
+        api_key = getattr(telnyx_client, "api_key", None)
+        if api_key:
+            masked_key = (
+                f"{api_key[:5]}..." if len(api_key) > 5 else "[REDACTED]"
+            )
+            logger.debug("Using client with API key: %s", masked_key)
 
     return service_cls(telnyx_client)
@@ -1,28 +1,138 @@
 """Direct ngrok tunnel handler using Unix domain sockets."""
 
-from datetime import datetime
+import logging
+import os
+import signal
 import sys
 import threading
-import time
-from typing import Optional
-
-try:
-    import ngrok
-except ImportError as e:
-    raise ImportError(
-        f"Failed to import ngrok. Please install it with 'pip install ngrok>=0.9.0'. Error: {e}"
-    )
+from types import MappingProxyType
+from typing import Optional, Tuple
 
 from ..config import settings
 from ..utils.logger import get_logger
 from .server import (
+    _now_iso,
     start_webhook_server,
     stop_webhook_server,
+    webhook_history,
 )
 
 logger = get_logger(__name__)
 
 
+# The ngrok SDK is a large compiled extension, so it is only imported on
+# first use (see _get_ngrok)
+_ngrok = None
+_ngrok_lock = threading.Lock()
+
+# Module-level ngrok SDK state that is reset during cleanup
+_ngrok_stateful_attrs: Tuple[str, ...] = ()
+
+# Loaded ngrok SDK modules
+_ngrok_modules: Tuple[str, ...] = ()
+
+
+def _get_ngrok():
+    """Import the ngrok SDK on first use and return the cached module.
+
+    The first call also resolves the SDK internals reset during cleanup
+    and patches ``ngrok.Config`` to force dynamic domains.
+
+    Raises:
+        ImportError: If the ngrok SDK is not installed
+    """
+    global _ngrok, _ngrok_stateful_attrs, _ngrok_modules
+
+    if _ngrok is not None:
+        return _ngrok
+
+    with _ngrok_lock:
+        if _ngrok is None:
+            try:
+                import ngrok
+            except ImportError as e:
+                raise ImportError(
+                    f"Failed to import ngrok. Please install it with 'pip install ngrok>=0.9.0'. Error: {e}"
+                )
+
+            _ngrok_stateful_attrs = tuple(
+                attr
+                for attr in (
+                    "_tunnels",
+                    "_listeners",
+                    "_sessions",
+                    "_endpoints",
+                    "_configs",
+                    "_connections",
+                )
+                if hasattr(ngrok, attr)
+            )
+            # Snapshot first: another thread may import while we scan
+            _ngrok_modules = tuple(
+                m for m in tuple(sys.modules) if m.startswith("ngrok")
+            )
+            _patch_ngrok_config(ngrok)
+            _ngrok = ngrok
+
+    return _ngrok
+
+
+def _patch_ngrok_config(ngrok) -> None:
+    """Patch ``ngrok.Config`` to ignore custom domains, at most once."""
+    try:
+        if not hasattr(ngrok, "Config"):
+            logger.info("NGrok Config not found, could not apply domain patch")
+            return
+
+        original_init = ngrok.Config.__init__
+        if getattr(original_init, "_telnyx_patched", False):
+            return
+
+        # Define a patched init that ignores domain
+        def patched_init(self, *args, **kwargs):
+            # Force domain to None before calling original
+            if "domain" in kwargs:
+                kwargs["domain"] = None
+            return original_init(self, *args, **kwargs)
+
+        patched_init._telnyx_patched = True
+
+        # Apply the patch
+        ngrok.Config.__init__ = patched_init
+        logger.info(
+            "Successfully patched NGrok Config to force dynamic domains"
+        )
+    except Exception as patch_err:
+        logger.warning("Error patching NGrok (non-fatal): %s", patch_err)
+
+
+# Guidance logged when ngrok rejects a session (ERR_NGROK_108)
+_NGROK_108_ADVICE = "\n".join(
+    (
+        "You currently have other NGrok sessions running. To fix this issue:",
+        "1. Go to https://dashboard.ngrok.com/agents to manage existing sessions",
+        "2. Or wait for other sessions to complete before restarting",
+        "3. Consider upgrading NGrok plan for more simultaneous sessions",
+    )
+)
+
+# Tunnel options that never change between start() calls; only the
+# authtoken flag is settings-dependent and gets added per call
+_SIMPLIFIED_OPTS = MappingProxyType(
+    {"metadata": "Telnyx MCP Webhook Handler (Simplified)"}
+)
+_MINIMAL_OPTS = MappingProxyType({})
+
+# Option sets tried in order when opening the tunnel
+_FORWARD_ATTEMPTS = (
+    ("simplified", _SIMPLIFIED_OPTS),
+    ("minimal", _MINIMAL_OPTS),
+)
+
+# Seconds between tunnel monitor checks
+RECONNECT_CHECK_INTERVAL = 30
+
+
 class NgrokTunnelHandler:
     """
     Ngrok tunnel handler using the official Python SDK without binary dependencies.
@@ -36,14 +146,17 @@ class NgrokTunnelHandler:
         self.listener = None
         self.public_url = None
         self._reconnect_thread = None
+        self._stop_event = threading.Event()
+        self._reconnection_attempts = 0
         self._running = False
         self.socket_path = None
         self._tunnel_was_established = (
             False  # Track if a tunnel was ever successfully established
         )
-
-        # Clean up internal SDK resources only (not processes)
-        self._cleanup_sdk_resources()
+        # Only clean up SDK state after a failed or lost session
+        self._needs_cleanup = False
+        # Set when the process is being terminated over a tunnel failure
+        self.fatal_error = False
 
     def _cleanup_sdk_resources(self):
         """Thoroughly clean up ngrok SDK resources without affecting external processes."""
@@ -51,14 +164,14 @@ class NgrokTunnelHandler:
 
         try:
             # Use the Python API to clean up resources
-            import ngrok
+            ngrok = _get_ngrok()
 
             try:
                 # Multiple disconnect attempts with different approaches
                 try:
                     # First generic disconnect
                     ngrok.disconnect()
-                    time.sleep(0.5)
+                    self._stop_event.wait(0.5)
 
                     # Then try to list and disconnect any tunnels specifically
                     if hasattr(ngrok, "list_tunnels"):
@@ -74,26 +187,17 @@ class NgrokTunnelHandler:
 
                     logger.info("Reset all ngrok connections via SDK")
                 except Exception as e:
-                    logger.warning(f"Failed to reset connections: {e}")
+                    logger.warning("Failed to reset connections: %s", e)
 
                 # Comprehensive module state cleanup
                 try:
                     # Clear anything that might store state
-                    attrs_to_clear = [
-                        "_tunnels",
-                        "_listeners",
-                        "_sessions",
-                        "_endpoints",
-                        "_configs",
-                        "_connections",
-                    ]
-
-                    for attr in attrs_to_clear:
-                        if hasattr(ngrok, attr):
-                            if isinstance(getattr(ngrok, attr), dict):
-                                setattr(ngrok, attr, {})
-                            elif isinstance(getattr(ngrok, attr), list):
-                                setattr(ngrok, attr, [])
+                    for attr in _ngrok_stateful_attrs:
+                        value = getattr(ngrok, attr)
+                        if isinstance(value, dict):
+                            setattr(ngrok, attr, {})
+                        elif isinstance(value, list):
+                            setattr(ngrok, attr, [])
 
                     # Reset API client if possible
                     if hasattr(ngrok, "api") and hasattr(ngrok.api, "_client"):
@@ -103,47 +207,22 @@ class NgrokTunnelHandler:
                 except Exception:
                     pass
             except Exception as e:
-                logger.warning(f"Failed during ngrok reset: {e}")
+                logger.warning("Failed during ngrok reset: %s", e)
 
         except Exception as e:
-            logger.warning(f"Error during ngrok SDK cleanup: {e}")
+            logger.warning("Error during ngrok SDK cleanup: %s", e)
 
-        # Immediately try to patch NGrok to ignore domain settings
+        # Also try to delete any module-level domain setting
         try:
-            import sys
-
-            import ngrok
-
-            # Try to force dynamic domains by monkey patching
-            if hasattr(ngrok, "Config"):
-                original_init = ngrok.Config.__init__
-
-                # Define a patched init that ignores domain
-                def patched_init(self, *args, **kwargs):
-                    # Force domain to None before calling original
-                    if "domain" in kwargs:
-                        kwargs["domain"] = None
-                    return original_init(self, *args, **kwargs)
-
-                # Apply the patch
-                ngrok.Config.__init__ = patched_init
-                logger.info(
-                    "Successfully patched NGrok Config to force dynamic domains"
-                )
-            else:
-                logger.info(
-                    "NGrok Config not found, could not apply domain patch"
-                )
-
-            # Also try to delete any module-level domain setting
-            ngrok_modules = [m for m in sys.modules if m.startswith("ngrok")]
-            for module_name in ngrok_modules:
-                module = sys.modules[module_name]
-                if hasattr(module, "domain"):
-                    setattr(module, "domain", None)
-                    logger.info(f"Reset domain in module {module_name}")
+            for module_name in _ngrok_modules:
+                module = sys.modules.get(module_name)
+                if getattr(module, "domain", None) is not None:
+                    module.domain = None
+                    logger.info("Reset domain in module %s", module_name)
         except Exception as patch_err:
-            logger.warning(f"Error patching NGrok (non-fatal): {patch_err}")
+            logger.warning(
+                "Error resetting NGrok domain (non-fatal): %s", patch_err
+            )
 
     def start(self) -> Optional[str]:
         """
@@ -153,7 +232,8 @@ class NgrokTunnelHandler:
             Optional[str]: The public URL for webhooks or None if startup fails
 
         Raises:
-            SystemExit: If webhook_enabled is true but the tunnel cannot be created
+            SystemExit: If webhook_enabled is true but the tunnel cannot be
+                created and this runs on the main thread
         """
         if not settings.webhook_enabled:
             logger.info("Webhook handler is disabled")
@@ -162,13 +242,16 @@ class NgrokTunnelHandler:
         if not settings.ngrok_enabled:
             # If webhooks are enabled but ngrok is disabled, this is a fatal configuration error
             logger.critical(
-                "FATAL ERROR: Webhook handler is enabled but NGrok is disabled"
-            )
-            logger.critical(
+                "FATAL ERROR: Webhook handler is enabled but NGrok is disabled\n"
                 "Webhooks cannot function without NGrok - exiting process"
             )
-            sys.exit(1)  # Exit with error status code
-            return None  # This will never execute
+            self._fail_fatally()
+            return None
+
+        # Allow a restart after a previous stop()
+        self._stop_event.clear()
+
+        ngrok = _get_ngrok()
 
         # Add authtoken if available
         if settings.ngrok_authtoken:
@@ -177,7 +260,7 @@ class NgrokTunnelHandler:
                 ngrok.set_auth_token(settings.ngrok_authtoken)
                 logger.info("Using ngrok authentication token")
             except Exception as e:
-                logger.error(f"Failed to set ngrok authentication token: {e}")
+                logger.error("Failed to set ngrok authentication token: %s", e)
                 return None
         else:
             logger.warning(
@@ -196,7 +279,7 @@ class NgrokTunnelHandler:
         # Ignore any custom domain settings to avoid TLS termination errors
         # Directly set ngrok_url to None in settings object to override any value
         if hasattr(settings, "ngrok_url") and settings.ngrok_url is not None:
-            logger.warning(f"Detected custom domain: {settings.ngrok_url}")
+            logger.warning("Detected custom domain: %s", settings.ngrok_url)
             logger.warning("OVERRIDING to force dynamic NGrok URL")
             # Hard override the setting at runtime
             try:
@@ -204,124 +287,54 @@ class NgrokTunnelHandler:
                 object.__setattr__(settings, "ngrok_url", None)
                 logger.info("Successfully forced ngrok_url to None")
             except Exception as e:
-                logger.warning(f"Could not override settings.ngrok_url: {e}")
+                logger.warning("Could not override settings.ngrok_url: %s", e)
 
         # Even if the above fails, still log that we're forcing dynamic domains
         logger.info("Forcing dynamic domain assignment for NGrok")
 
         try:
-            # Aggressive cleanup of any existing ngrok resources (our own only)
-            try:
-                logger.info(
-                    "Aggressively cleaning up existing ngrok SDK resources..."
-                )
-
-                # Multiple disconnect attempts to be thorough
-                try:
-                    ngrok.disconnect()
-                    time.sleep(0.5)
-                    # Try again to be sure
-                    ngrok.disconnect()
-                    time.sleep(0.5)
-                except Exception:
-                    pass
-
-                # Clean up internal SDK state more thoroughly
-                try:
-                    # Reset any module-level state
-                    import importlib
-
-                    ngrok_module = importlib.import_module("ngrok")
-
-                    # Clear any cached tunnels
-                    if hasattr(ngrok_module, "_tunnels"):
-                        ngrok_module._tunnels = {}
-                    if hasattr(ngrok_module, "_listeners"):
-                        ngrok_module._listeners = {}
-                    if hasattr(ngrok_module, "api"):
-                        # Reset API client if possible
-                        ngrok_module.api._client = None
-
-                    logger.info("Reset ngrok module internal state completely")
-                except Exception as reset_err:
-                    logger.warning(
-                        f"Could not fully reset ngrok module state: {reset_err}"
-                    )
-
-                # Wait a bit to let any previous sessions expire
-                time.sleep(1)
-            except Exception as cleanup_err:
-                logger.warning(
-                    f"Failed during aggressive ngrok cleanup: {cleanup_err}"
-                )
+            # Clean up leftover ngrok SDK state (our own only), but only
+            # after a previous session failed or was lost
+            if self._needs_cleanup:
+                self._cleanup_sdk_resources()
+                self._needs_cleanup = False
 
             # Prepare the Unix socket address
             unix_sock_addr = f"unix:{self.socket_path}"
-            logger.info(f"Forwarding to Unix socket: {unix_sock_addr}")
-
-            # More aggressive options to force dynamic domain - direct approach
-            options = {
-                "authtoken_from_env": bool(settings.ngrok_authtoken),
-                "metadata": "Telnyx MCP Webhook Handler (Direct)",
-                "verify_webhook_provider": "",  # Disable webhook verification
-                "app_protocol": "http1",  # Explicitly use HTTP/1.1
-                "domain": None,  # Explicitly set domain to None to force dynamic assignment
-            }
-
-            # Force override any custom domain settings from environment or cache
-            if hasattr(ngrok, "set_config"):
+            logger.info("Forwarding to Unix socket: %s", unix_sock_addr)
+
+            authtoken_from_env = bool(settings.ngrok_authtoken)
+
+            # Use the basic forward function rather than the Session API
+            # (which caused TLS termination issues), dropping options on
+            # each retry
+            last_err = None
+            for name, extra_options in _FORWARD_ATTEMPTS:
+                attempt_options = {
+                    "authtoken_from_env": authtoken_from_env,
+                    **extra_options,
+                }
+                logger.info(
+                    "Creating NGrok tunnel with %s options: %s",
+                    name,
+                    attempt_options,
+                )
                 try:
-                    ngrok.set_config(domain=None)
-                    logger.info(
-                        "Explicitly disabled custom domain in NGrok configuration"
+                    self.listener = ngrok.forward(
+                        unix_sock_addr, **attempt_options
                     )
-                except Exception as config_err:
+                except Exception as forward_err:
+                    last_err = forward_err
                     logger.warning(
-                        f"Could not override NGrok domain config: {config_err}"
+                        "NGrok tunnel with %s options failed: %s",
+                        name,
+                        forward_err,
                     )
-
-            # Create the tunnel - use the most direct approach possible
-            logger.info(
-                f"Creating ngrok tunnel with direct approach and options: {options}"
-            )
-
-            # Instead of using the Session API which is causing TLS termination issues,
-            # Use a simplified direct approach without any custom domains or TLS options
-            try:
-                # Generate an extremely simplified set of options - remove TLS-related options
-                simplified_options = {
-                    "authtoken_from_env": bool(settings.ngrok_authtoken),
-                    "metadata": "Telnyx MCP Webhook Handler (Simplified)",
-                }
-
-                # Skip the Session API approach entirely and use the basic forward function
-                logger.info(
-                    f"Creating NGrok tunnel with simplified options: {simplified_options}"
-                )
-                self.listener = ngrok.forward(
-                    unix_sock_addr, **simplified_options
-                )
-                logger.info(
-                    "Created NGrok tunnel using simplified forward method"
-                )
-            except Exception as module_err:
-                # Final fallback with minimal options and different syntax
-                logger.warning(
-                    f"First approach failed: {module_err}, trying minimal fallback"
-                )
-                # Try with the absolute minimum options possible
-                minimal_options = {
-                    "authtoken_from_env": bool(settings.ngrok_authtoken),
-                }
-                logger.info(
-                    f"Creating NGrok tunnel with minimal options: {minimal_options}"
-                )
-                self.listener = ngrok.forward(
-                    unix_sock_addr, **minimal_options
-                )
-                logger.info(
-                    "Created NGrok tunnel using minimal options approach"
-                )
+                    continue
+                logger.info("Created NGrok tunnel using %s options", name)
+                break
+            else:
+                raise last_err
 
             # Get the public URL
             self.public_url = self.listener.url()
@@ -334,17 +347,20 @@ class NgrokTunnelHandler:
             self._start_reconnect_thread()
 
             logger.info(
-                f"Ngrok tunnel established with dynamic URL: {self.public_url}"
+                "Ngrok tunnel established with dynamic URL: %s",
+                self.public_url,
             )
             logger.info(
-                f"Webhook endpoint available at: {self.public_url}{settings.webhook_path}"
+                "Webhook endpoint available at: %s%s",
+                self.public_url,
+                settings.webhook_path,
             )
 
             # Add a webhook to history to show it's working
             self._add_to_history(
                 {
                     "event_type": "ngrok.tunnel.started",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                     "url": self.public_url,
                     "webhook_endpoint": f"{self.public_url}{settings.webhook_path}",
                     "dynamic_url": True,
@@ -353,18 +369,15 @@ class NgrokTunnelHandler:
 
             return self.public_url
         except Exception as e:
+            self._needs_cleanup = True
             error_message = str(e)
-            logger.error(f"Failed to start ngrok tunnel: {error_message}")
+            logger.error("Failed to start ngrok tunnel: %s", error_message)
 
             # If session limit error, provide guidance but don't kill processes
             if "ERR_NGROK_108" in error_message:
                 logger.error(
-                    "Detected NGrok session limit error - cannot create a new tunnel"
-                )
-                logger.error(
-                    "There are other NGrok sessions running that need to be closed"
-                )
-                logger.error(
+                    "Detected NGrok session limit error - cannot create a new tunnel\n"
+                    "There are other NGrok sessions running that need to be closed\n"
                     "Manual intervention required: check https://dashboard.ngrok.com/agents"
                 )
 
@@ -372,7 +385,7 @@ class NgrokTunnelHandler:
             self._add_to_history(
                 {
                     "event_type": "ngrok.error",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": _now_iso(),
                     "error": error_message,
                     "error_type": "tls_error"
                     if "tls" in error_message.lower()
@@ -387,35 +400,39 @@ class NgrokTunnelHandler:
             # Check for the specific ERR_NGROK_108 error (session limit)
             if "ERR_NGROK_108" in error_message:
                 logger.critical(
-                    f"FATAL ERROR: NGrok session limit exceeded: {error_message}"
-                )
-                logger.critical(
-                    "You currently have other NGrok sessions running. To fix this issue:"
-                )
-                logger.critical(
-                    "1. Go to https://dashboard.ngrok.com/agents to manage existing sessions"
-                )
-                logger.critical(
-                    "2. Or wait for other sessions to complete before restarting"
-                )
-                logger.critical(
-                    "3. Consider upgrading NGrok plan for more simultaneous sessions"
+                    "FATAL ERROR: NGrok session limit exceeded: %s\n%s",
+                    error_message,
+                    _NGROK_108_ADVICE,
                 )
             else:
                 logger.critical(
-                    f"FATAL ERROR: NGrok tunnel failed to start: {error_message}"
+                    "FATAL ERROR: NGrok tunnel failed to start: %s",
+                    error_message,
                 )
 
             # Clean up and exit with a clear error message - webhooks are critical
             stop_webhook_server()
             logger.critical(
-                "FATAL ERROR: Cannot continue without NGrok tunnel for webhooks"
+                "FATAL ERROR: Cannot continue without NGrok tunnel for webhooks\n"
+                "Specific error: %s\n"
+                "Please fix NGrok configuration issues before restarting",
+                error_message,
             )
-            logger.critical(f"Specific error: {error_message}")
-            logger.critical(
-                "Please fix NGrok configuration issues before restarting"
-            )
-            sys.exit(1)  # Exit with error code - fail decisively
+            self._fail_fatally()
+            return None
+
+    def _fail_fatally(self) -> None:
+        """Terminate the process after an unrecoverable tunnel error.
+
+        ``sys.exit`` only ends the calling thread when used off the main
+        thread, so the monitor thread sends SIGTERM to its own process
+        instead and lets the main thread's signal handler shut down.
+        """
+        self.fatal_error = True
+        if threading.current_thread() is threading.main_thread():
+            sys.exit(1)
+        self._running = False
+        os.kill(os.getpid(), signal.SIGTERM)
 
     def _start_reconnect_thread(self):
         """Start a thread to monitor and reconnect the tunnel if needed."""
@@ -429,122 +446,122 @@ class NgrokTunnelHandler:
         self._reconnect_thread.start()
 
     def _reconnect_loop(self):
-        """Background thread: monitor the tunnel and reconnect if needed."""
+        """Background thread: periodically check and reconnect the tunnel."""
         logger.info("Starting ngrok tunnel monitor thread")
-        reconnection_attempts = 0
-        max_reconnection_attempts = 3
+        self._reconnection_attempts = 0
 
         while self._running:
-            time.sleep(30)  # Check every 30 seconds
-
+            # Wait for the next check, waking early if stop() is called
+            if self._stop_event.wait(RECONNECT_CHECK_INTERVAL):
+                break
             if not self._running:
                 break
 
             try:
-                # If we have a listener and public URL, we're good
-                if self.listener and self.public_url:
-                    reconnection_attempts = (
-                        0  # Reset counter on successful connection
-                    )
-                    continue
-                else:
-                    # If the tunnel was previously established but is now gone, this is a critical error
-                    if (
-                        self._running
-                        and hasattr(self, "_tunnel_was_established")
-                        and self._tunnel_was_established
-                    ):
-                        logger.critical(
-                            "FATAL ERROR: NGrok tunnel was previously established but has been lost"
-                        )
-                        logger.critical(
-                            "Webhooks are required for MCP server operation"
-                        )
-                        logger.critical(
-                            "The server will exit. Please restart when NGrok is available."
-                        )
-                        sys.exit(1)  # Exit with error code - fail decisively
-
-                # Check if we've exceeded max reconnection attempts
-                if reconnection_attempts >= max_reconnection_attempts:
-                    logger.critical(
-                        f"FATAL ERROR: Exceeded {max_reconnection_attempts} NGrok tunnel reconnection attempts"
-                    )
-                    logger.critical(
-                        "Webhooks are required for operation - exiting process immediately"
-                    )
+                self._attempt_reconnect()
+            except Exception as e:
+                logger.error("Error in tunnel monitor thread: %s", e)
 
-                    # Record the terminal error in webhook history
-                    try:
-                        self._add_to_history(
-                            {
-                                "event_type": "ngrok.error.terminal",
-                                "timestamp": datetime.now().isoformat(),
-                                "error": f"Exceeded {max_reconnection_attempts} reconnection attempts",
-                                "error_type": "reconnection_failure",
-                            }
-                        )
-                    except Exception:
-                        pass  # Ignore any errors in recording history at this point
-
-                    # Exit with a clear error message - webhooks are critical
-                    logger.critical(
-                        "FATAL ERROR: Max reconnection attempts exceeded for NGrok tunnel"
-                    )
-                    logger.critical(
-                        "Webhooks are required for MCP server operation"
-                    )
-                    sys.exit(1)  # Exit with error code - fail decisively
+        logger.info("Tunnel monitor thread stopped")
+
+    def _attempt_reconnect(self):
+        """Reconnect the tunnel if it is no longer active."""
+        max_reconnection_attempts = 3
 
-                # Increment attempt counter
-                reconnection_attempts += 1
-                logger.warning(
-                    f"Tunnel not active, attempting to reconnect (attempt {reconnection_attempts}/{max_reconnection_attempts})..."
+        # If we have a listener and public URL, we're good
+        if self.listener and self.public_url:
+            self._reconnection_attempts = 0  # Reset counter on success
+            return
+        else:
+            # If the tunnel was previously established but is now gone, this is a critical error
+            if (
+                self._running
+                and hasattr(self, "_tunnel_was_established")
+                and self._tunnel_was_established
+            ):
+                logger.critical(
+                    "FATAL ERROR: NGrok tunnel was previously established but has been lost\n"
+                    "Webhooks are required for MCP server operation\n"
+                    "The server will exit. Please restart when NGrok is available."
                 )
+                self._fail_fatally()
+                return
 
-                # Try to stop existing resources
-                try:
-                    self.stop()
-                except Exception as stop_error:
-                    logger.error(
-                        f"Error stopping existing tunnel: {stop_error}"
-                    )
+        # Check if we've exceeded max reconnection attempts
+        if self._reconnection_attempts >= max_reconnection_attempts:
+            # Record the terminal error in webhook history
+            try:
+                self._add_to_history(
+                    {
+                        "event_type": "ngrok.error.terminal",
+                        "timestamp": _now_iso(),
+                        "error": f"Exceeded {max_reconnection_attempts} reconnection attempts",
+                        "error_type": "reconnection_failure",
+                    }
+                )
+            except Exception:
+                pass  # Ignore any errors in recording history at this point
 
-                time.sleep(2)  # Brief delay before reconnecting
+            # Exit with a clear error message - webhooks are critical
+            logger.critical(
+                "FATAL ERROR: Exceeded %d NGrok tunnel reconnection attempts\n"
+                "Webhooks are required for operation - exiting process immediately",
+                max_reconnection_attempts,
+            )
+            self._fail_fatally()
+            return
 
-                # Try to start a new tunnel
-                try:
-                    new_url = self.start()
-                    if new_url:
-                        logger.info(
-                            f"Successfully reconnected tunnel. New URL: {new_url}"
-                        )
-                        reconnection_attempts = 0  # Reset counter on success
-                    else:
-                        logger.error("Failed to reconnect tunnel")
-                except Exception as start_error:
-                    logger.error(f"Error starting new tunnel: {start_error}")
-            except Exception as e:
-                logger.error(f"Error in tunnel monitor thread: {e}")
+        # Increment attempt counter
+        self._reconnection_attempts += 1
+        logger.warning(
+            "Tunnel not active, attempting to reconnect (attempt %s/%s)...",
+            self._reconnection_attempts,
+            max_reconnection_attempts,
+        )
 
-        logger.info("Tunnel monitor thread stopped")
+        # Try to stop existing resources
+        try:
+            self._teardown()
+        except Exception as stop_error:
+            logger.error("Error stopping existing tunnel: %s", stop_error)
+
+        # Brief delay before reconnecting, cut short by stop()
+        if self._stop_event.wait(2):
+            return
+
+        # Try to start a new tunnel
+        try:
+            new_url = self.start()
+            if new_url:
+                logger.info(
+                    "Successfully reconnected tunnel. New URL: %s", new_url
+                )
+                self._reconnection_attempts = 0  # Reset counter on success
+            else:
+                self._needs_cleanup = True
+                logger.error("Failed to reconnect tunnel")
+        except Exception as start_error:
+            self._needs_cleanup = True
+            logger.error("Error starting new tunnel: %s", start_error)
 
     def _add_to_history(self, data):
         """Add an event to the webhook history."""
-        from .server import webhook_history
-
         webhook_history.appendleft(
             {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": data.get("timestamp") or _now_iso(),
                 "event_type": data.get("event_type", "unknown"),
                 "payload": data,
             }
         )
-        logger.debug(f"Added event to history (total: {len(webhook_history)})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Added event to history (total: %s)", len(webhook_history)
+            )
 
     def stop(self) -> None:
         """Stop the tunnel and clean up resources."""
         self._running = False
+        self._stop_event.set()
 
         # First stop the reconnect thread to prevent race conditions
         if self._reconnect_thread and self._reconnect_thread.is_alive():
@@ -556,10 +573,15 @@ class NgrokTunnelHandler:
                         "Reconnect thread did not terminate in time"
                     )
             except Exception as thread_err:
-                logger.error(f"Error stopping reconnect thread: {thread_err}")
+                logger.error("Error stopping reconnect thread: %s", thread_err)
 
         # Then stop the tunnel
+        self._teardown()
+
+    def _teardown(self) -> None:
+        """Close the tunnel and stop the webhook server."""
         if self.listener:
+            ngrok = _get_ngrok()
             try:
                 logger.info("Stopping ngrok tunnel...")
 
@@ -570,7 +592,7 @@ class NgrokTunnelHandler:
                         # Newer SDK versions
                         self.listener.close()
                 except Exception as close_err:
-                    logger.warning(f"Error closing listener: {close_err}")
+                    logger.warning("Error closing listener: %s", close_err)
 
                 try:
                     # Try disconnecting specifically for older SDK versions
@@ -581,11 +603,11 @@ class NgrokTunnelHandler:
                             # Fallback - disconnect all
                             ngrok.disconnect()
                 except Exception as disconnect_err:
-                    logger.warning(f"Error disconnecting: {disconnect_err}")
+                    logger.warning("Error disconnecting: %s", disconnect_err)
 
                 logger.info("Ngrok tunnel stopped successfully")
             except Exception as e:
-                logger.error(f"Error stopping ngrok tunnel: {e}")
+                logger.error("Error stopping ngrok tunnel: %s", e)
 
         # Stop the webhook server
         stop_webhook_server()
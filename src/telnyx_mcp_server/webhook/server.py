@@ -2,29 +2,192 @@
 
 from collections import deque
 from datetime import datetime
+from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler
+from itertools import islice
 import json
+import logging
+from operator import itemgetter
 import os
+import queue
+import re
 from socketserver import UnixStreamServer
 import tempfile
 import threading
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..config import settings
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Prefer orjson for the webhook (de)serialization hot path when available
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+
+    def _json_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _json_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# Last formatted second, as (unix_seconds, iso_string)
+_last_iso: Tuple[int, str] = (-1, "")
+
+
+def _now_iso() -> str:
+    """Return the current local time in ISO 8601 format with microseconds.
+
+    The date and time are formatted at most once per second; only the
+    microseconds are rendered on every call.
+    """
+    global _last_iso
+
+    now = time.time()
+    sec = int(now)
+    cached_sec, prefix = _last_iso
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec).isoformat()
+        _last_iso = (sec, prefix)
+    return f"{prefix}.{int((now - sec) * 1_000_000):06d}"
+
+
+def _header_template(status: HTTPStatus, *extra_headers: bytes) -> bytes:
+    """Pre-encode the status line and headers of a JSON response.
+
+    ``Content-Length`` is left as a ``%d`` placeholder, filled in per
+    response so headers and body go out in a single write.
+    """
+    return b"".join(
+        (
+            b"HTTP/1.1 %d %s\r\n" % (status, status.phrase.encode("ascii")),
+            b"Content-Type: application/json; charset=utf-8\r\n",
+            b"Content-Length: %d\r\n",
+            b"Connection: close\r\n",
+            b"X-Webhook-Handler: Telnyx-MCP-Unix-Socket\r\n",
+            *extra_headers,
+            b"\r\n",
+        )
+    )
+
+
+# Response header templates by status code, built once at import
+_RESPONSE_HEADERS = {
+    HTTPStatus.OK: _header_template(
+        HTTPStatus.OK, b"Cache-Control: no-store, no-cache\r\n"
+    ),
+    HTTPStatus.REQUEST_ENTITY_TOO_LARGE: _header_template(
+        HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    ),
+    HTTPStatus.INTERNAL_SERVER_ERROR: _header_template(
+        HTTPStatus.INTERNAL_SERVER_ERROR
+    ),
+}
+
+_TOO_LARGE_BODY = b'{"status":"error","message":"Request entity too large"}'
+
+# Pre-encoded parts of the health check response body
+_HEALTH_BODY_PREFIX = b'{"status":"ok","time":"'
+_HEALTH_BODY_PATH = b'","path":'
+_HEALTH_BODY_SUFFIX = b',"webhook_server":"Telnyx-MCP-Unix-Socket"}'
+
+# Maximum number of request body bytes read per call
+BODY_READ_CHUNK_SIZE = 64 * 1024
+
+# Request headers recorded with each webhook history entry
+HISTORY_HEADERS = (
+    "Content-Type",
+    "User-Agent",
+    "Telnyx-Signature-Ed25519",
+    "Telnyx-Timestamp",
+)
+
+# Leading bytes of a summarized payload kept in webhook history
+HISTORY_PREVIEW_SIZE = 512
+
+_get_event_type = itemgetter("event_type")
+
+# Leading bytes of an oversized body scanned for its summary fields
+HISTORY_SCAN_SIZE = 4096
+_HEAD_FIELD_RE = re.compile(
+    rb'"(event_type|id|occurred_at)"\s*:\s*"([^"\\]*)"'
+)
+
 # Store webhook history (most recent first)
 webhook_history = deque(maxlen=100)  # Store last 100 webhooks
 
 
+def _event_type(payload: Dict[str, Any]) -> str:
+    """Return a webhook's event type, checking root level and nested data.
+
+    This handles both {event_type: "x"} and {data: {event_type: "x"}}
+    formats, defaulting to "unknown".
+    """
+    try:
+        return _get_event_type(payload)
+    except KeyError:
+        data = payload.get("data")
+        if isinstance(data, dict):
+            return data.get("event_type", "unknown")
+        return "unknown"
+
+
+def _scan_head(body: bytearray) -> Dict[str, str]:
+    """Extract event_type, id and occurred_at from the start of a body.
+
+    Used instead of a full JSON parse for bodies too large to keep in
+    history. Telnyx puts these fields ahead of the (potentially large)
+    nested payload, so the first match of each within the scanned head
+    is taken.
+    """
+    fields: Dict[str, str] = {}
+    for match in _HEAD_FIELD_RE.finditer(body, 0, HISTORY_SCAN_SIZE):
+        fields.setdefault(
+            match.group(1).decode("ascii"),
+            match.group(2).decode("utf-8", "replace"),
+        )
+    return fields
+
+
+def _summarize_payload(
+    fields: Dict[str, str], body: bytearray
+) -> Dict[str, Any]:
+    """Summarize a webhook payload too large to keep in history."""
+    return {
+        "id": fields.get("id"),
+        "occurred_at": fields.get("occurred_at"),
+        "payload_bytes": len(body),
+        "payload_preview": body[:HISTORY_PREVIEW_SIZE].decode(
+            "utf-8", "replace"
+        ),
+    }
+
+
 class UnixSocketHandler(BaseHTTPRequestHandler):
     """HTTP request handler for Unix domain sockets."""
 
     # Ensure HTTP/1.1 is used consistently
     protocol_version = "HTTP/1.1"
 
+    # Socket timeout (seconds) so a stalled client cannot pin a worker
+    timeout = 30
+
+    # Buffer request reads in body-sized chunks rather than the 8 KB
+    # default; responses go out in a single write, so wfile stays
+    # unbuffered
+    rbufsize = BODY_READ_CHUNK_SIZE
+
     # Override address_string to fix the IndexError with Unix sockets
     def address_string(self):
         """Return a string representation of the client address."""
@@ -39,12 +202,17 @@ class UnixSocketHandler(BaseHTTPRequestHandler):
         try:
             message = format % args
             logger.info(
-                f"[UnixSocketHandler] {self.command} {self.path} - {message}"
+                "[UnixSocketHandler] %s %s - %s",
+                self.command,
+                self.path,
+                message,
             )
         except Exception as e:
             # Failsafe logging that doesn't rely on string formatting
             logger.info(
-                f"[UnixSocketHandler] Request processed: {self.command} {self.path}"
+                "[UnixSocketHandler] Request processed: %s %s",
+                self.command,
+                self.path,
             )
 
     def do_POST(self):
@@ -52,209 +220,206 @@ class UnixSocketHandler(BaseHTTPRequestHandler):
         try:
             # Get content length
             content_length = int(self.headers.get("Content-Length", 0))
-            if content_length > settings.webhook_max_body_size:
-                self.send_error(413, "Request entity too large")
+            if content_length > self.server.max_body_size:
+                self._send_bytes(
+                    HTTPStatus.REQUEST_ENTITY_TOO_LARGE, _TOO_LARGE_BODY
+                )
                 return
 
-            # Read the request body
-            body = self.rfile.read(content_length)
-
-            # Process the webhook request
-            self._process_webhook(body)
+            # Read and process the webhook request
+            self._process_webhook(self._read_body(content_length))
 
-            # Prepare a valid JSON response
-            response = json.dumps(
+            # Fixed ASCII shape; only the timestamp varies
+            response_bytes = (
+                '{"status":"success","message":"Webhook received",'
+                f'"timestamp":"{_now_iso()}"}}'
+            ).encode("ascii")
+        except Exception as e:
+            logger.error("Error handling webhook: %s", e)
+            response_bytes = _json_dumps(
                 {
-                    "status": "success",
-                    "message": "Webhook received",
-                    "timestamp": datetime.now().isoformat(),
+                    "status": "error",
+                    "message": str(e),
+                    "timestamp": _now_iso(),
                 }
             )
-            response_bytes = response.encode("utf-8")
+            self._send_bytes(HTTPStatus.INTERNAL_SERVER_ERROR, response_bytes)
+            return
 
-            try:
-                # Send a properly formatted HTTP response with more robust error handling
-                self.send_response(200)
-                # Set headers with proper HTTP/1.1 compliance
-                self.send_header(
-                    "Content-Type", "application/json; charset=utf-8"
-                )
-                self.send_header("Content-Length", str(len(response_bytes)))
-                self.send_header(
-                    "Connection", "close"
-                )  # Important for HTTP/1.1
-                # Add more headers to help with debugging
-                self.send_header("X-Webhook-Handler", "Telnyx-MCP-Unix-Socket")
-                self.send_header("Cache-Control", "no-store, no-cache")
-                self.end_headers()
-
-                # Write the response in a try-except block
-                try:
-                    self.wfile.write(response_bytes)
-                    self.wfile.flush()  # Ensure the response is sent completely
-                except (BrokenPipeError, ConnectionResetError) as pipe_error:
-                    # Client disconnected - log but don't re-raise
-                    logger.warning(
-                        f"Client disconnected during response: {pipe_error}"
-                    )
-                except Exception as write_error:
-                    logger.error(f"Error writing response: {write_error}")
-                    # Don't re-raise - we've already processed the webhook
-            except Exception as resp_error:
-                logger.error(f"Error sending HTTP response: {resp_error}")
-                # Don't re-raise - we've already processed the webhook
-        except Exception as e:
-            logger.error(f"Error handling webhook: {str(e)}")
-            # Send a properly formatted error response with enhanced robustness
-            try:
-                error_response = json.dumps(
-                    {
-                        "status": "error",
-                        "message": str(e),
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                )
-                error_bytes = error_response.encode("utf-8")
-
-                self.send_response(500)
-                self.send_header(
-                    "Content-Type", "application/json; charset=utf-8"
-                )
-                self.send_header("Content-Length", str(len(error_bytes)))
-                self.send_header("Connection", "close")
-                self.send_header("X-Webhook-Handler", "Telnyx-MCP-Unix-Socket")
-                self.end_headers()
-
-                # Write error response with exception handling
-                try:
-                    self.wfile.write(error_bytes)
-                    self.wfile.flush()
-                except (BrokenPipeError, ConnectionResetError):
-                    # Client disconnected - just log it
-                    logger.warning("Client disconnected during error response")
-                except Exception as write_err:
-                    logger.error(f"Error writing error response: {write_err}")
-            except Exception as resp_err:
-                logger.error(f"Failed to send error response: {resp_err}")
+        self._send_bytes(HTTPStatus.OK, response_bytes)
 
     def do_GET(self):
         """Handle GET requests for health checks."""
-        try:
-            # Prepare a valid JSON response
-            response = json.dumps(
-                {
-                    "status": "ok",
-                    "time": datetime.now().isoformat(),
-                    "path": self.path,
-                    "webhook_server": "Telnyx-MCP-Unix-Socket",
-                }
+        # Only the timestamp and the (JSON-escaped) path vary per probe
+        response_bytes = b"".join(
+            (
+                _HEALTH_BODY_PREFIX,
+                _now_iso().encode("ascii"),
+                _HEALTH_BODY_PATH,
+                _json_dumps(self.path),
+                _HEALTH_BODY_SUFFIX,
             )
-            response_bytes = response.encode("utf-8")
-
-            # Send a properly formatted HTTP response with robust error handling
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json; charset=utf-8")
-            self.send_header("Content-Length", str(len(response_bytes)))
-            self.send_header("Connection", "close")
-            self.send_header("X-Webhook-Handler", "Telnyx-MCP-Unix-Socket")
-            self.send_header("Cache-Control", "no-store, no-cache")
-            self.end_headers()
-
-            # Write the response with exception handling
-            try:
-                self.wfile.write(response_bytes)
-                self.wfile.flush()  # Ensure the response is sent completely
-            except (BrokenPipeError, ConnectionResetError) as pipe_error:
-                # Client disconnected - log but don't re-raise
-                logger.warning(
-                    f"Client disconnected during health check response: {pipe_error}"
-                )
-            except Exception as write_error:
-                logger.error(
-                    f"Error writing health check response: {write_error}"
-                )
-        except Exception as e:
-            logger.error(f"Error handling health check request: {str(e)}")
-            # Try to send an error response
-            try:
-                error_response = json.dumps(
-                    {"status": "error", "message": str(e)}
-                )
-                error_bytes = error_response.encode("utf-8")
-                self.send_response(500)
-                self.send_header(
-                    "Content-Type", "application/json; charset=utf-8"
-                )
-                self.send_header("Content-Length", str(len(error_bytes)))
-                self.send_header("Connection", "close")
-                self.end_headers()
-                self.wfile.write(error_bytes)
-                self.wfile.flush()
-            except Exception:
-                # If that also fails, just log and continue
-                logger.error("Failed to send health check error response")
+        )
+        self._send_bytes(HTTPStatus.OK, response_bytes)
 
-    def _process_webhook(self, body: bytes) -> None:
+    def _send_bytes(self, status: HTTPStatus, body: bytes) -> None:
+        """Send a complete JSON response with a single write.
+
+        Write failures are logged rather than raised, since the request
+        has already been handled by the time its response is sent.
+        """
+        self.log_request(status, len(body))
+        self.close_connection = True
+        try:
+            self.wfile.write(_RESPONSE_HEADERS[status] % len(body) + body)
+        except (BrokenPipeError, ConnectionResetError) as e:
+            # Client disconnected - log but don't re-raise
+            logger.warning("Client disconnected during response: %s", e)
+        except OSError as e:
+            logger.error("Error writing response: %s", e)
+
+    def _read_body(self, length: int) -> bytearray:
+        """Read up to ``length`` bytes of request body in bounded chunks.
+
+        The body is read into a single preallocated buffer; a short
+        result means the client closed the connection early.
+        """
+        body = bytearray(length)
+        received = 0
+        with memoryview(body) as view:
+            while received < length:
+                count = self.rfile.readinto(
+                    view[received : received + BODY_READ_CHUNK_SIZE]
+                )
+                if not count:
+                    break
+                received += count
+        if received < length:
+            del body[received:]
+        return body
+
+    def _history_headers(self) -> Dict[str, str]:
+        """Return the request headers worth keeping in webhook history."""
+        headers = {}
+        for name in HISTORY_HEADERS:
+            value = self.headers.get(name)
+            if value is not None:
+                headers[name] = value
+        return headers
+
+    def _process_webhook(self, body: bytearray) -> None:
         """Process the webhook request."""
         try:
-            # Parse the request body as JSON
             if body:
-                payload = json.loads(body)
-
-                # Extract event type from payload - check both root level and nested data
-                # This handles both {event_type: "x"} and {data: {event_type: "x"}} formats
-                if "event_type" in payload:
-                    event_type = payload.get("event_type", "unknown")
+                max_payload = self.server.history_max_payload_size
+                if max_payload and len(body) > max_payload:
+                    # Only summarized in history: scan the head of the
+                    # body instead of parsing all of it
+                    fields = _scan_head(body)
+                    event_type = fields.get("event_type", "unknown")
+                    payload = None
                 else:
-                    # Fall back to checking in data object or default to unknown
-                    event_type = payload.get("data", {}).get(
-                        "event_type", "unknown"
-                    )
+                    # Parse the request body as JSON
+                    payload = _json_loads(body)
+
+                    event_type = _event_type(payload)
 
                 # Log the webhook
-                logger.info(f"Received webhook event: {event_type}")
-                logger.debug(
-                    f"Webhook payload: {json.dumps(payload, indent=2)}"
-                )
+                logger.info("Received webhook event: %s", event_type)
+                if payload is not None and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Webhook payload: %s", _json_pretty(payload))
 
                 # Store in history
-                webhook_history.appendleft(
-                    {
-                        "timestamp": datetime.now().isoformat(),
-                        "event_type": event_type,
-                        "payload": payload,
-                        "headers": dict(self.headers),
-                    }
-                )
+                entry = {
+                    "timestamp": _now_iso(),
+                    "event_type": event_type,
+                    "headers": self._history_headers(),
+                }
+                if payload is None:
+                    entry["payload_summary"] = _summarize_payload(fields, body)
+                else:
+                    entry["payload"] = payload
+                webhook_history.appendleft(entry)
 
                 logger.debug(
-                    f"Added webhook to history (total: {len(webhook_history)})"
+                    "Added webhook to history (total: %s)",
+                    len(webhook_history),
                 )
             else:
                 logger.warning("Received empty webhook body")
         except json.JSONDecodeError:
             logger.error("Failed to parse webhook payload as JSON")
         except Exception as e:
-            logger.error(f"Error processing webhook: {str(e)}")
+            logger.error("Error processing webhook: %s", e)
             raise  # Re-raise to allow proper error response
 
 
 class UnixSocketHTTPServer(UnixStreamServer):
-    """HTTP server using Unix domain sockets."""
+    """HTTP server using Unix domain sockets.
+
+    Requests are handled on a small, bounded pool of worker threads, so a
+    slow webhook does not hold up the ones behind it without spawning a
+    thread per connection. The workers are daemon threads, so a stalled
+    client never delays process exit.
+    """
+
+    # Accept backlog for bursts of webhook deliveries
+    request_queue_size = 128
+
+    # Worker threads handling requests concurrently
+    max_workers = 8
 
     def __init__(self, server_address, RequestHandlerClass):
         """Initialize the server with a Unix socket."""
         super().__init__(server_address, RequestHandlerClass)
         self._thread = None
         self._running = False
+        # Snapshot per-request limits once instead of reading settings
+        self.max_body_size = settings.webhook_max_body_size
+        self.history_max_payload_size = (
+            settings.webhook_history_max_payload_size
+        )
+        # Accepted connections waiting for a worker; None stops a worker
+        self._requests: "queue.SimpleQueue[Optional[Tuple[Any, Any]]]" = (
+            queue.SimpleQueue()
+        )
+        self._workers: List[threading.Thread] = []
+
+    def process_request(self, request, client_address):
+        """Hand the accepted connection to the worker pool."""
+        self._requests.put((request, client_address))
+
+    def _process_requests(self):
+        """Worker thread: handle queued connections until told to stop."""
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+            request, client_address = item
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
 
     def start(self):
         """Start the server in a background thread."""
         self._running = True
+        self._workers = [
+            threading.Thread(
+                target=self._process_requests,
+                name=f"webhook-{i}",
+                daemon=True,
+            )
+            for i in range(self.max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
         self._thread = threading.Thread(target=self.serve_forever)
         self._thread.daemon = True
         self._thread.start()
-        logger.info(f"Unix socket server started on {self.server_address}")
+        logger.info("Unix socket server started on %s", self.server_address)
 
     def stop(self):
         """Stop the server."""
@@ -263,25 +428,66 @@ class UnixSocketHTTPServer(UnixStreamServer):
             self.shutdown()
             if self._thread and self._thread.is_alive():
                 self._thread.join(timeout=5.0)
+            self._stop_workers()
             self.server_close()
 
             # Clean up the socket file
             try:
-                if os.path.exists(self.server_address):
-                    os.unlink(self.server_address)
-                    logger.info(f"Removed socket file: {self.server_address}")
+                os.unlink(self.server_address)
+                logger.info("Removed socket file: %s", self.server_address)
+            except FileNotFoundError:
+                pass
             except OSError as e:
-                logger.warning(f"Error removing socket file: {e}")
+                logger.warning("Error removing socket file: %s", e)
+
+    def _stop_workers(self):
+        """Close connections still waiting for a worker and stop the pool.
 
+        Workers busy with a request finish it on their own; they are not
+        waited for.
+        """
+        while True:
+            try:
+                item = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self.shutdown_request(item[0])
+        for _ in self._workers:
+            self._requests.put(None)
+        self._workers = []
+
+
+# Prefix of the private directory created to hold the socket
+SOCKET_DIR_PREFIX = "telnyx_mcp_"
 
 # Global server instance
 socket_server = None
 socket_path = None
 
 
+def _socket_base_dir() -> Optional[str]:
+    """Return the directory to create the socket directory in.
+
+    Uses the configured ``socket_dir`` if set, otherwise the per-user
+    runtime directory (a tmpfs on systemd systems). ``None`` means the
+    system temp directory.
+    """
+    if settings.socket_dir:
+        return settings.socket_dir
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or (
+        f"/run/user/{os.getuid()}"
+    )
+    if os.path.isdir(runtime_dir) and os.access(runtime_dir, os.W_OK):
+        return runtime_dir
+    return None
+
+
 def generate_socket_path() -> str:
     """Generate a unique socket path."""
-    temp_dir = tempfile.mkdtemp(prefix="telnyx_mcp_")
+    temp_dir = tempfile.mkdtemp(
+        prefix=SOCKET_DIR_PREFIX, dir=_socket_base_dir()
+    )
     socket_name = f"webhook-{os.getpid()}.sock"
     path = os.path.join(temp_dir, socket_name)
     return path
@@ -297,9 +503,9 @@ def get_webhook_history(limit: int = None) -> List[Dict[str, Any]]:
     Returns:
         List of webhook events, most recent first
     """
-    if limit is None or limit > len(webhook_history):
+    if limit is None:
         return list(webhook_history)
-    return list(webhook_history)[:limit]
+    return list(islice(webhook_history, limit))
 
 
 def start_webhook_server() -> Optional[str]:
@@ -318,17 +524,15 @@ def start_webhook_server() -> Optional[str]:
     try:
         # Generate a unique socket path
         socket_path = generate_socket_path()
-        logger.info(f"Using Unix domain socket at: {socket_path}")
-
-        # Create the directory if it doesn't exist
-        os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+        logger.info("Using Unix domain socket at: %s", socket_path)
 
         # Clean up any existing socket file
-        if os.path.exists(socket_path):
-            try:
-                os.unlink(socket_path)
-            except OSError as e:
-                logger.warning(f"Could not remove existing socket file: {e}")
+        try:
+            os.unlink(socket_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove existing socket file: %s", e)
 
         # Create and start the server
         socket_server = UnixSocketHTTPServer(socket_path, UnixSocketHandler)
@@ -341,7 +545,7 @@ def start_webhook_server() -> Optional[str]:
 
         return socket_path
     except Exception as e:
-        logger.error(f"Failed to start webhook server: {e}")
+        logger.error("Failed to start webhook server: %s", e)
         return None
 
 
@@ -356,14 +560,14 @@ def stop_webhook_server() -> None:
 
     # Clean up the socket directory
     if socket_path:
-        try:
-            dir_path = os.path.dirname(socket_path)
-            if os.path.exists(dir_path) and dir_path.startswith(
-                tempfile.gettempdir()
-            ):
+        dir_path = os.path.dirname(socket_path)
+        if os.path.basename(dir_path).startswith(SOCKET_DIR_PREFIX):
+            try:
                 os.rmdir(dir_path)
-                logger.info(f"Removed socket directory: {dir_path}")
-        except OSError as e:
-            logger.warning(f"Error removing socket directory: {e}")
+                logger.info("Removed socket directory: %s", dir_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Error removing socket directory: %s", e)
 
         socket_path = None
@@ -0,0 +1,17 @@
+"""Shared pytest fixtures for the Telnyx MCP server tests."""
+
+import os
+
+import pytest
+
+# Set the API key before any test module imports the settings; a fixture
+# would run too late for the module-level imports in the test files.
+os.environ["TELNYX_API_KEY"] = "test_key"
+
+from telnyx_mcp_server.telnyx.client import TelnyxClient  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def telnyx_client():
+    """Create one Telnyx client for the whole test session."""
+    return TelnyxClient(api_key="test_key")
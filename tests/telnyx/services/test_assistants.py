@@ -1,11 +1,16 @@
 """Tests for the Telnyx Assistants service."""
 
+from types import MappingProxyType
 from unittest.mock import MagicMock
 
 import pytest
 
 from telnyx_mcp_server.telnyx.services.assistants import AssistantsService
 
+_POST_RESPONSE = MappingProxyType(
+    {"id": "test-assistant", "name": "Test Assistant"}
+)
+
 
 class TestAssistantsService:
     """Tests for the AssistantsService class."""
@@ -14,10 +19,7 @@ class TestAssistantsService:
     def mock_client(self):
         """Create a mock Telnyx client."""
         mock = MagicMock()
-        mock.post.return_value = {
-            "id": "test-assistant",
-            "name": "Test Assistant",
-        }
+        mock.post.return_value = _POST_RESPONSE
         return mock
 
     def test_create_assistant_hardcoded_values(self, mock_client):
@@ -1,17 +1,20 @@
 """Tests for the Telnyx embeddings service."""
 
+from types import MappingProxyType
 from unittest.mock import MagicMock
 
 import pytest
 
 from telnyx_mcp_server.telnyx.services.embeddings import EmbeddingsService
 
+_LIST_RESPONSE = MappingProxyType({"data": [{"id": "test-bucket-id"}]})
+
 
 @pytest.fixture
 def mock_client():
     """Create a mock Telnyx client."""
     client = MagicMock()
-    client.get.return_value = {"data": [{"id": "test-bucket-id"}]}
+    client.get.return_value = _LIST_RESPONSE
     return client
 
 
@@ -37,32 +40,25 @@ def test_embed_url_without_bucket(mock_client):
     )
 
 
-def test_create_embeddings_basic(mock_client):
-    """Test creating embeddings without specifying a model."""
-    service = EmbeddingsService(client=mock_client)
-    request = {
-        "bucket_name": "test-bucket",
-    }
-    _ = service.create_embeddings(request=request)
-
-    mock_client.post.assert_called_once_with(
-        "ai/embeddings",
-        data=request,
-    )
-
-
-def test_create_embeddings_all_fields(mock_client):
-    """Test creating embeddings with a specified model."""
+@pytest.mark.parametrize(
+    "request_body",
+    [
+        {"bucket_name": "test-bucket"},
+        {
+            "bucket_name": "test-bucket",
+            "document_chunk_size": 100,
+            "document_chunk_overlap_size": 20,
+            "embedding_model": "thenlper/gte-large",
+        },
+    ],
+    ids=["basic", "all_fields"],
+)
+def test_create_embeddings(mock_client, request_body):
+    """Test creating embeddings with and without optional fields."""
     service = EmbeddingsService(client=mock_client)
-    request = {
-        "bucket_name": "test-bucket",
-        "document_chunk_size": 100,
-        "document_chunk_overlap_size": 20,
-        "embedding_model": "thenlper/gte-large",
-    }
-    result = service.create_embeddings(request=request)
+    _ = service.create_embeddings(request=request_body)
 
     mock_client.post.assert_called_once_with(
         "ai/embeddings",
-        data=request,
+        data=request_body,
     )
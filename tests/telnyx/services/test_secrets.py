@@ -1,19 +1,24 @@
 """Tests for the Telnyx secrets manager service."""
 
+from types import MappingProxyType
 from unittest.mock import MagicMock
 
 import pytest
 
 from telnyx_mcp_server.telnyx.services.secrets import SecretsService
 
+_LIST_RESPONSE = MappingProxyType({"data": [{"id": "test-id"}]})
+_CREATE_RESPONSE = MappingProxyType({"data": {"id": "new-id"}})
+_DELETE_RESPONSE = MappingProxyType({})
+
 
 @pytest.fixture
 def mock_client():
     """Create a mock Telnyx client."""
     client = MagicMock()
-    client.get.return_value = {"data": [{"id": "test-id"}]}
-    client.post.return_value = {"data": {"id": "new-id"}}
-    client.delete.return_value = {}
+    client.get.return_value = _LIST_RESPONSE
+    client.post.return_value = _CREATE_RESPONSE
+    client.delete.return_value = _DELETE_RESPONSE
     return client
 
 
@@ -31,48 +36,31 @@ def test_list_integration_secrets(mock_client):
     assert result == {"data": [{"id": "test-id"}]}
 
 
-def test_create_integration_secret_bearer(mock_client):
-    """Test creating a bearer integration secret."""
-    service = SecretsService(client=mock_client)
-    result = service.create_integration_secret(
-        request={
-            "identifier": "test-identifier",
-            "type": "bearer",
-            "token": "test-token",
-        }
-    )
-
-    mock_client.post.assert_called_once_with(
-        "integration_secrets",
-        data={
+@pytest.mark.parametrize(
+    "request_body",
+    [
+        {
             "identifier": "test-identifier",
             "type": "bearer",
             "token": "test-token",
         },
-    )
-    assert result == {"data": {"id": "new-id"}}
-
-
-def test_create_integration_secret_basic(mock_client):
-    """Test creating a basic integration secret."""
-    service = SecretsService(client=mock_client)
-    result = service.create_integration_secret(
-        request={
+        {
             "identifier": "test-identifier",
             "type": "basic",
             "username": "test-user",
             "password": "test-pass",
-        }
-    )
+        },
+    ],
+    ids=["bearer", "basic"],
+)
+def test_create_integration_secret(mock_client, request_body):
+    """Test creating bearer and basic integration secrets."""
+    service = SecretsService(client=mock_client)
+    result = service.create_integration_secret(request=request_body)
 
     mock_client.post.assert_called_once_with(
         "integration_secrets",
-        data={
-            "identifier": "test-identifier",
-            "type": "basic",
-            "username": "test-user",
-            "password": "test-pass",
-        },
+        data=request_body,
     )
     assert result == {"data": {"id": "new-id"}}
 
@@ -16,9 +16,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger("id-validation-test")
 
+# Run every test in this module on one shared event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 # Server URL
 SERVER_URL = "http://localhost:8000/mcp"
 
+# JSON-RPC envelope fields shared by every call_tool request
+_REQUEST_TEMPLATE = {"jsonrpc": "2.0", "method": "callTool"}
+
+
+# Response returned by the mocked client; built once and only read by tests
+_CANNED_RESPONSE = {
+    "jsonrpc": "2.0",
+    "result": {
+        "data": [
+            {
+                "id": "12345",
+                "phone_number": "+1234567890",
+                "status": "active",
+            }
+        ]
+    },
+    "id": "test-request",
+}
+
 
 class MockResponse:
     def __init__(self, status_code=200, json_data=None):
@@ -29,26 +51,16 @@ class MockResponse:
         return self._json_data
 
 
-@pytest.fixture
-def mock_httpx_client(mocker: MockerFixture):
-    """Mock httpx.AsyncClient"""
-    mock_client = mocker.AsyncMock()
-    mock_client.post.return_value = MockResponse(
-        json_data={
-            "jsonrpc": "2.0",
-            "result": {
-                "data": [
-                    {
-                        "id": "12345",
-                        "phone_number": "+1234567890",
-                        "status": "active",
-                    }
-                ]
-            },
-            "id": "test-request",
-        }
-    )
-    mocker.patch("httpx.AsyncClient", return_value=mock_client)
+@pytest.fixture(scope="module")
+def mock_httpx_client(module_mocker: MockerFixture):
+    """Mock httpx.AsyncClient, once for the whole module.
+
+    The mock always returns the same canned response, so sharing it
+    between tests is safe.
+    """
+    mock_client = module_mocker.AsyncMock()
+    mock_client.post.return_value = MockResponse(json_data=_CANNED_RESPONSE)
+    module_mocker.patch("httpx.AsyncClient", return_value=mock_client)
     return mock_client
 
 
@@ -71,13 +83,12 @@ async def call_tool(
     """
     request_id = request_id or "test-request"
     request_data = {
-        "jsonrpc": "2.0",
-        "method": "callTool",
+        **_REQUEST_TEMPLATE,
         "params": {"name": tool_name, "parameters": parameters},
         "id": request_id,
     }
 
-    logger.info(f"Calling tool: {tool_name} with parameters: {parameters}")
+    logger.info("Calling tool: %s with parameters: %s", tool_name, parameters)
     if client:
         response = await client.post(SERVER_URL, json=request_data)
     else:
@@ -85,11 +96,10 @@ async def call_tool(
             response = await client.post(SERVER_URL, json=request_data)
 
     response_data = response.json()
-    logger.info(f"Response: {response_data}")
+    logger.info("Response: %s", response_data)
     return response_data
 
 
-@pytest.mark.asyncio
 async def test_list_phone_numbers(mock_httpx_client) -> None:
     """Test list_phone_numbers tool."""
     logger.info("\n=== Testing list_phone_numbers ===")
@@ -104,65 +114,46 @@ async def test_list_phone_numbers(mock_httpx_client) -> None:
     assert "data" in response["result"]
 
 
-@pytest.mark.asyncio
-async def test_get_phone_number_string_id(mock_httpx_client) -> None:
-    """Test get_phone_number tool with string ID."""
-    logger.info("\n=== Testing get_phone_number with string ID ===")
-    phone_number_id = "12345"
-
-    response = await call_tool(
-        "get_phone_number",
-        {"id": str(phone_number_id)},
-        "get-phone-number-string-request",
-        client=mock_httpx_client,
-    )
-    assert "error" not in response
-    assert "result" in response
-
-
-@pytest.mark.asyncio
-async def test_get_phone_number_numeric_id(mock_httpx_client) -> None:
-    """Test get_phone_number tool with numeric ID."""
-    logger.info("\n=== Testing get_phone_number with numeric ID ===")
-    phone_number_id = 12345
-
-    response = await call_tool(
-        "get_phone_number",
-        {"id": phone_number_id},
-        "get-phone-number-numeric-request",
-        client=mock_httpx_client,
-    )
-    assert "error" not in response
-    assert "result" in response
-
-
-@pytest.mark.asyncio
-async def test_update_phone_number_string_id(mock_httpx_client) -> None:
-    """Test update_phone_number tool with string ID."""
-    logger.info("\n=== Testing update_phone_number with string ID ===")
-    phone_number_id = "12345"
-
-    response = await call_tool(
-        "update_phone_number",
-        {"id": str(phone_number_id), "data": {"tags": ["test-tag"]}},
-        "update-phone-number-string-request",
-        client=mock_httpx_client,
-    )
-    assert "error" not in response
-    assert "result" in response
-
-
-@pytest.mark.asyncio
-async def test_update_phone_number_numeric_id(mock_httpx_client) -> None:
-    """Test update_phone_number tool with numeric ID."""
-    logger.info("\n=== Testing update_phone_number with numeric ID ===")
-    phone_number_id = 12345
-
+@pytest.mark.parametrize(
+    "tool_name, parameters, request_id",
+    [
+        (
+            "get_phone_number",
+            {"id": "12345"},
+            "get-phone-number-string-request",
+        ),
+        (
+            "get_phone_number",
+            {"id": 12345},
+            "get-phone-number-numeric-request",
+        ),
+        (
+            "update_phone_number",
+            {"id": "12345", "data": {"tags": ["test-tag"]}},
+            "update-phone-number-string-request",
+        ),
+        (
+            "update_phone_number",
+            {"id": 12345, "data": {"tags": ["test-tag"]}},
+            "update-phone-number-numeric-request",
+        ),
+    ],
+    ids=[
+        "get-string-id",
+        "get-numeric-id",
+        "update-string-id",
+        "update-numeric-id",
+    ],
+)
+async def test_phone_number_id_types(
+    mock_httpx_client,
+    tool_name: str,
+    parameters: Dict[str, Any],
+    request_id: str,
+) -> None:
+    """Test phone number tools accept both string and numeric IDs."""
     response = await call_tool(
-        "update_phone_number",
-        {"id": phone_number_id, "data": {"tags": ["test-tag"]}},
-        "update-phone-number-numeric-request",
-        client=mock_httpx_client,
+        tool_name, parameters, request_id, client=mock_httpx_client
     )
     assert "error" not in response
     assert "result" in response
@@ -1,35 +1,34 @@
 """Basic smoke test for the Telnyx MCP server."""
 
-import os
+import inspect
 from unittest.mock import patch
 
 import pytest
 
-# Set the environment variable before importing the modules that need it
-os.environ["TELNYX_API_KEY"] = "test_key"
-
-# Now import the modules that require the environment variable
 from telnyx_mcp_server.mcp import mcp
 from telnyx_mcp_server.telnyx.client import TelnyxClient
 from telnyx_mcp_server.tools.assistants import list_assistants
 
+# Response returned by the mocked client; built once and only read by tests
+_ASSISTANTS_RESPONSE = {
+    "data": [{"id": "test-assistant", "name": "Test Assistant"}]
+}
+
 
 @pytest.fixture
 def mock_telnyx_client():
     """Create a mock Telnyx client for testing."""
     with patch("telnyx_mcp_server.telnyx.client.TelnyxClient.get") as mock_get:
-        mock_get.return_value = {
-            "data": [{"id": "test-assistant", "name": "Test Assistant"}]
-        }
+        mock_get.return_value = _ASSISTANTS_RESPONSE
         yield mock_get
 
 
-@pytest.mark.asyncio
-async def test_mcp_initialization():
+def test_mcp_initialization():
     """Test that the MCP server initializes correctly."""
-    assert isinstance(mcp, object)
-    assert hasattr(mcp, "_mcp_server")
-    assert hasattr(mcp, "run")
+    # getattr_static raises AttributeError if the attribute is missing,
+    # without triggering descriptors or lazy initialization on the server
+    inspect.getattr_static(mcp, "_mcp_server")
+    inspect.getattr_static(mcp, "run")
 
 
 @pytest.mark.asyncio
@@ -43,20 +42,13 @@ async def test_list_assistants_tool(mock_telnyx_client):
 
 
 @pytest.mark.asyncio
-async def test_telnyx_client_initialization():
+async def test_telnyx_client_initialization(telnyx_client):
     """Test that the Telnyx client initializes correctly."""
     # Verify the client can be initialized with an API key
-    client = TelnyxClient(api_key="test_key")
-    assert client.api_key == "test_key"
+    assert telnyx_client.api_key == "test_key"
 
     # Verify settings API key is used when no key is provided
-    with patch("telnyx_mcp_server.config.settings") as mock_settings:
+    with patch("telnyx_mcp_server.telnyx.client.settings") as mock_settings:
         mock_settings.telnyx_api_key = "settings_test_key"
-        # Create a new mock to replace the TelnyxClient._init_ method
-        with patch.object(
-            TelnyxClient, "__init__", return_value=None
-        ) as mock_init:
-            client = TelnyxClient()
-            client.api_key = "settings_test_key"  # we need to set this manually since we mocked __init__
-            mock_init.assert_called_once()
-            assert client.api_key == "settings_test_key"
+        client = TelnyxClient()
+        assert client.api_key == "settings_test_key"
@@ -0,0 +1,25 @@
+"""Shared fixtures for the MCP tool tests."""
+
+import pytest
+
+
+@pytest.fixture
+def call_tool(mock_get_service, mock_service):
+    """Return a helper that calls a tool and checks what it forwarded.
+
+    Each tool forwards to the service method of the same name, which must
+    have been called once, exactly as ``service_call`` (a ``mock.call``).
+    The ``mock_get_service`` and ``mock_service`` fixtures come from the
+    requesting test module.
+    """
+
+    async def call(tool, tool_kwargs, service_call):
+        result = await tool(**tool_kwargs)
+
+        mock_get_service.assert_called_once()
+        getattr(mock_service, tool.__name__).assert_called_once_with(
+            *service_call.args, **service_call.kwargs
+        )
+        return result
+
+    return call
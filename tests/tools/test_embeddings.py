@@ -1,9 +1,10 @@
 """Tests for the embeddings MCP tools."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import call, create_autospec, patch
 
 import pytest
 
+from telnyx_mcp_server.telnyx.services.embeddings import EmbeddingsService
 from telnyx_mcp_server.tools.embeddings import (
     create_embeddings,
     embed_url,
@@ -11,10 +12,10 @@ from telnyx_mcp_server.tools.embeddings import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_service():
-    """Create a mock EmbeddingsService."""
-    service = MagicMock()
+    """Create a mock EmbeddingsService, shared by every test in the module."""
+    service = create_autospec(EmbeddingsService, instance=True)
     service.list_embedded_buckets.return_value = {
         "data": [{"id": "test-bucket-id"}]
     }
@@ -25,49 +26,60 @@ def mock_service():
     return service
 
 
-@pytest.mark.asyncio
-@patch("telnyx_mcp_server.tools.embeddings.get_authenticated_service")
-async def test_list_embedded_buckets(mock_get_service, mock_service):
-    """Test the list_embedded_buckets tool."""
-    mock_get_service.return_value = mock_service
-
-    result = await list_embedded_buckets({"page": 2, "page_size": 10})
-
-    mock_get_service.assert_called_once()
-    mock_service.list_embedded_buckets.assert_called_once_with(
-        page=2, page_size=10
-    )
-    assert result == {"data": [{"id": "test-bucket-id"}]}
+@pytest.fixture(autouse=True)
+def mock_get_service(mock_service):
+    """Patch get_authenticated_service to return the shared mock."""
+    with patch(
+        "telnyx_mcp_server.tools.embeddings.get_authenticated_service",
+        return_value=mock_service,
+    ) as mock_get_service:
+        yield mock_get_service
 
 
-@pytest.mark.asyncio
-@patch("telnyx_mcp_server.tools.embeddings.get_authenticated_service")
-async def test_embed_url(mock_get_service, mock_service):
-    """Test the embed_url tool."""
-    mock_get_service.return_value = mock_service
-
-    request = {"url": "https://example.com", "bucket": "my-bucket"}
+@pytest.fixture(autouse=True)
+def _reset_service(mock_service):
+    """Start each test with no calls recorded on the shared mock."""
+    mock_service.reset_mock()
 
-    result = await embed_url(request)
 
-    mock_get_service.assert_called_once()
-    mock_service.embed_url.assert_called_once_with(**request)
-    assert result == {"data": {"bucket": "test-bucket"}}
+_EMBED_URL_REQUEST = {"url": "https://example.com"}
+_CREATE_EMBEDDINGS_REQUEST = {
+    "bucket_name": "my-bucket",
+    "embedding_model": "thenlper/gte-large",
+}
 
 
 @pytest.mark.asyncio
-@patch("telnyx_mcp_server.tools.embeddings.get_authenticated_service")
-async def test_create_embeddings(mock_get_service, mock_service):
-    """Test the create_embeddings tool."""
-    mock_get_service.return_value = mock_service
-
-    request = {
-        "texts": ["Hello world", "Test text"],
-        "model": "text-embedding-ada-002",
-    }
-
-    result = await create_embeddings(request)
+@pytest.mark.parametrize(
+    "tool, tool_kwargs, service_call, expected",
+    [
+        pytest.param(
+            list_embedded_buckets,
+            {},
+            call(),
+            {"data": [{"id": "test-bucket-id"}]},
+            id="list_embedded_buckets",
+        ),
+        pytest.param(
+            embed_url,
+            {"request": _EMBED_URL_REQUEST},
+            call(_EMBED_URL_REQUEST),
+            {"data": {"bucket": "test-bucket"}},
+            id="embed_url",
+        ),
+        pytest.param(
+            create_embeddings,
+            {"request": _CREATE_EMBEDDINGS_REQUEST},
+            call(_CREATE_EMBEDDINGS_REQUEST),
+            {"data": {"embeddings": [[0.1, 0.2, 0.3]]}},
+            id="create_embeddings",
+        ),
+    ],
+)
+async def test_embeddings_tool(
+    call_tool, tool, tool_kwargs, service_call, expected
+):
+    """Test that each embeddings tool forwards to its service method."""
+    result = await call_tool(tool, tool_kwargs, service_call)
 
-    mock_get_service.assert_called_once()
-    mock_service.create_embeddings.assert_called_once_with(**request)
-    assert result == {"data": {"embeddings": [[0.1, 0.2, 0.3]]}}
+    assert result == expected
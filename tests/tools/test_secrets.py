@@ -1,9 +1,10 @@
 """Tests for the secrets manager MCP tools."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, create_autospec, patch
 
 import pytest
 
+from telnyx_mcp_server.telnyx.services.secrets import SecretsService
 from telnyx_mcp_server.tools.secrets import (
     create_integration_secret,
     delete_integration_secret,
@@ -11,10 +12,10 @@ from telnyx_mcp_server.tools.secrets import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_service():
-    """Create a mock SecretsService."""
-    service = MagicMock()
+    """Create a mock SecretsService, shared by every test in the module."""
+    service = create_autospec(SecretsService, instance=True)
     service.list_integration_secrets.return_value = {
         "data": [{"id": "test-id"}]
     }
@@ -23,52 +24,91 @@ def mock_service():
     return service
 
 
-@pytest.mark.asyncio
-@patch("telnyx_mcp_server.tools.secrets.get_authenticated_service")
-async def test_list_integration_secrets(mock_get_service, mock_service):
-    """Test the list_integration_secrets tool."""
-    mock_get_service.return_value = mock_service
-
-    result = await list_integration_secrets(
-        {"page": 2, "page_size": 10, "filter_type": "bearer"}
-    )
-
-    mock_get_service.assert_called_once()
-    mock_service.list_integration_secrets.assert_called_once_with(
-        page=2, page_size=10, filter_type="bearer"
-    )
-    assert result == {"data": [{"id": "test-id"}]}
+@pytest.fixture(autouse=True)
+def mock_get_service(mock_service):
+    """Patch get_authenticated_service to return the shared mock."""
+    with patch(
+        "telnyx_mcp_server.tools.secrets.get_authenticated_service",
+        return_value=mock_service,
+    ) as mock_get_service:
+        yield mock_get_service
 
 
-@pytest.mark.asyncio
-@patch("telnyx_mcp_server.tools.secrets.get_authenticated_service")
-async def test_create_integration_secret(mock_get_service, mock_service):
-    """Test the create_integration_secret tool."""
-    mock_get_service.return_value = mock_service
-
-    request = {
-        "identifier": "test-identifier",
-        "type": "bearer",
-        "token": "test-token",
-    }
+@pytest.fixture(autouse=True)
+def _reset_service(mock_service):
+    """Start each test with no calls recorded on the shared mock."""
+    mock_service.reset_mock()
 
-    result = await create_integration_secret(request)
 
-    mock_get_service.assert_called_once()
-    mock_service.create_integration_secret.assert_called_once_with(**request)
-    assert result == {"data": {"id": "new-id"}}
+_CREATE_SECRET_REQUEST = {
+    "identifier": "test-identifier",
+    "type": "bearer",
+    "token": "test-token",
+}
 
 
 @pytest.mark.asyncio
-@patch("telnyx_mcp_server.tools.secrets.get_authenticated_service")
-async def test_delete_integration_secret(mock_get_service, mock_service):
-    """Test the delete_integration_secret tool."""
-    mock_get_service.return_value = mock_service
+@pytest.mark.parametrize(
+    "tool, tool_kwargs, service_call, expected",
+    [
+        pytest.param(
+            list_integration_secrets,
+            {"request": {"page": 2, "page_size": 10, "filter_type": "bearer"}},
+            call(page=2, page_size=10, filter_type="bearer"),
+            {"data": [{"id": "test-id"}]},
+            id="list_integration_secrets",
+        ),
+        pytest.param(
+            list_integration_secrets,
+            {"request": {}},
+            call(),
+            {"data": [{"id": "test-id"}]},
+            id="list_integration_secrets_defaults",
+        ),
+        pytest.param(
+            create_integration_secret,
+            {"request": _CREATE_SECRET_REQUEST},
+            call(_CREATE_SECRET_REQUEST),
+            {"data": {"id": "new-id"}},
+            id="create_integration_secret",
+        ),
+        pytest.param(
+            delete_integration_secret,
+            {"id": "test-id"},
+            call(id="test-id"),
+            {},
+            id="delete_integration_secret",
+        ),
+    ],
+)
+async def test_secrets_tool(
+    call_tool, tool, tool_kwargs, service_call, expected
+):
+    """Test that each secrets tool forwards to its service method."""
+    result = await call_tool(tool, tool_kwargs, service_call)
 
-    result = await delete_integration_secret(id="test-id")
+    assert result == expected
 
-    mock_get_service.assert_called_once()
-    mock_service.delete_integration_secret.assert_called_once_with(
-        id="test-id"
+
+@pytest.mark.asyncio
+async def test_list_integration_secrets_builds_query():
+    """Test that the request fields reach the API as query parameters."""
+    client = MagicMock()
+    client.get.return_value = {"data": []}
+
+    with patch(
+        "telnyx_mcp_server.tools.secrets.get_authenticated_service",
+        return_value=SecretsService(client=client),
+    ):
+        await list_integration_secrets(
+            request={"page": 2, "page_size": 10, "filter_type": "bearer"}
+        )
+
+    client.get.assert_called_once_with(
+        "integration_secrets",
+        params={
+            "page[number]": 2,
+            "page[size]": 10,
+            "filter[type]": "bearer",
+        },
     )
-    assert result == {}
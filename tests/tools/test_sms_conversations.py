@@ -0,0 +1,127 @@
+"""Tests for the SMS conversations resource."""
+
+from unittest.mock import patch
+
+import pytest
+
+from telnyx_mcp_server.tools import sms_conversations
+from telnyx_mcp_server.tools.sms_conversations import (
+    _extract_conversation_details,
+)
+from telnyx_mcp_server.webhook.server import webhook_history
+
+
+def _sms_event(event_id, timestamp, text="Hello"):
+    """Build a webhook history entry for an inbound SMS."""
+    return {
+        "timestamp": timestamp,
+        "event_type": "message.received",
+        "payload": {
+            "data": {
+                "event_type": "message.received",
+                "id": event_id,
+                "payload": {
+                    "id": f"msg-{event_id}",
+                    "from": {"phone_number": "+15551234567"},
+                    "to": [{"phone_number": "+15557654321"}],
+                    "text": text,
+                    "direction": "inbound",
+                    "received_at": "2025-01-01T00:00:00Z",
+                },
+            },
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clear_parsed_events():
+    """Start every test with an empty parse cache."""
+    sms_conversations._parsed_events.clear()
+    yield
+    sms_conversations._parsed_events.clear()
+
+
+@pytest.fixture
+def parse_spy():
+    """Count calls to the per-event parser."""
+    with patch.object(
+        sms_conversations,
+        "_parse_message_event",
+        wraps=sms_conversations._parse_message_event,
+    ) as spy:
+        yield spy
+
+
+def test_reuses_parsed_events_across_calls(parse_spy):
+    """Test that re-reading the same history does not re-parse events."""
+    events = [
+        _sms_event("event-1", "2025-01-01T00:00:00.000001"),
+        _sms_event("event-2", "2025-01-01T00:00:01.000001"),
+    ]
+
+    first = _extract_conversation_details(events)
+    second = _extract_conversation_details(events)
+
+    assert parse_spy.call_count == 2
+    assert first == second
+    assert first[0]["message_count"] == 2
+
+
+def test_deduplicates_redelivered_events(parse_spy):
+    """Test that redeliveries of one Telnyx event are counted once."""
+    events = [
+        _sms_event("event-1", "2025-01-01T00:00:05.000001"),
+        # Same event delivered again, received at a different time
+        _sms_event("event-1", "2025-01-01T00:00:00.000001"),
+    ]
+
+    result = _extract_conversation_details(events)
+
+    assert parse_spy.call_count == 1
+    assert len(result) == 1
+    assert result[0]["message_count"] == 1
+
+
+def test_does_not_merge_unidentifiable_events(parse_spy):
+    """Test that events with no ID or timestamp are each parsed."""
+    events = [
+        _sms_event(None, None, text="First"),
+        _sms_event(None, None, text="Second"),
+    ]
+
+    result = _extract_conversation_details(events)
+
+    assert parse_spy.call_count == 2
+    assert result[0]["message_count"] == 2
+    assert sms_conversations._parsed_events == {}
+
+
+def test_drops_events_no_longer_in_history(parse_spy):
+    """Test that the parse cache forgets events that left the history."""
+    events = [
+        _sms_event(f"event-{i}", f"2025-01-01T00:00:0{i}.000001")
+        for i in range(3)
+    ]
+
+    with patch.object(sms_conversations, "MAX_PARSED_EVENTS", 2):
+        _extract_conversation_details(events)
+        assert set(sms_conversations._parsed_events) == {
+            "event-0",
+            "event-1",
+            "event-2",
+        }
+
+        # The oldest event has dropped out of the history
+        _extract_conversation_details(events[:2])
+        assert set(sms_conversations._parsed_events) == {
+            "event-0",
+            "event-1",
+        }
+
+    # The remaining events were not parsed again
+    assert parse_spy.call_count == 3
+
+
+def test_cache_bound_matches_webhook_history():
+    """Test that the parse cache is bounded by the webhook history size."""
+    assert sms_conversations.MAX_PARSED_EVENTS == webhook_history.maxlen
@@ -0,0 +1,121 @@
+"""Tests for the error handling utilities."""
+
+import inspect
+from typing import Any, Dict
+from unittest.mock import MagicMock, patch
+
+from fastmcp import FastMCP
+import pytest
+import requests
+
+from telnyx_mcp_server.utils.error_handler import telnyx_tool
+
+
+def _http_error(detail: str) -> requests.HTTPError:
+    """Build an HTTPError whose response carries a Telnyx error body."""
+    response = MagicMock()
+    response.json.return_value = {"errors": [{"detail": detail}]}
+    return requests.HTTPError("400 Client Error", response=response)
+
+
+@pytest.fixture
+def mock_logger():
+    """Patch the error handler's logger."""
+    with patch("telnyx_mcp_server.utils.error_handler.logger") as logger:
+        yield logger
+
+
+def test_wraps_sync_function():
+    """Test that sync functions stay sync and return their result."""
+
+    @telnyx_tool("doing things")
+    def tool(value: int) -> int:
+        return value + 1
+
+    assert not inspect.iscoroutinefunction(tool)
+    assert tool(1) == 2
+
+
+@pytest.mark.asyncio
+async def test_wraps_async_function():
+    """Test that async functions stay async and return their result."""
+
+    @telnyx_tool("doing things")
+    async def tool(value: int) -> int:
+        return value + 1
+
+    assert inspect.iscoroutinefunction(tool)
+    assert await tool(1) == 2
+
+
+def test_sync_error_is_logged_and_translated(mock_logger):
+    """Test that Telnyx API errors from sync tools are translated."""
+
+    @telnyx_tool("listing things")
+    def tool() -> None:
+        raise _http_error("Invalid page size")
+
+    with pytest.raises(Exception, match="^Telnyx API error: Invalid page"):
+        tool()
+
+    mock_logger.error.assert_called_once()
+    assert mock_logger.error.call_args.args[0].startswith(
+        "Error listing things: 400 Client Error"
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_error_is_logged_and_translated(mock_logger):
+    """Test that Telnyx API errors from async tools are translated."""
+
+    @telnyx_tool("creating thing")
+    async def tool() -> None:
+        raise _http_error("Missing identifier")
+
+    with pytest.raises(Exception, match="^Telnyx API error: Missing"):
+        await tool()
+
+    mock_logger.error.assert_called_once()
+    assert mock_logger.error.call_args.args[0].startswith(
+        "Error creating thing: 400 Client Error"
+    )
+
+
+@pytest.mark.asyncio
+async def test_other_errors_are_reraised(mock_logger):
+    """Test that errors other than HTTP errors are re-raised unchanged."""
+    error = ValueError("bad value")
+
+    @telnyx_tool("checking thing")
+    async def tool() -> None:
+        raise error
+
+    with pytest.raises(ValueError) as excinfo:
+        await tool()
+
+    assert excinfo.value is error
+    mock_logger.error.assert_called_once_with(
+        "Error checking thing: bad value"
+    )
+
+
+def test_keeps_signature_for_tool_schema():
+    """Test that mcp.tool() builds the same schema for a wrapped function."""
+
+    async def tool(request: Dict[str, Any], page: int = 1) -> Dict[str, Any]:
+        """List things."""
+        return {}
+
+    wrapped = telnyx_tool("listing things")(tool)
+
+    assert wrapped.__name__ == "tool"
+    assert wrapped.__doc__ == "List things."
+    assert inspect.signature(wrapped) == inspect.signature(tool)
+
+    mcp = FastMCP("test")
+    mcp.tool()(wrapped)
+    (registered,) = mcp._tool_manager.list_tools()
+    assert registered.name == "tool"
+    assert registered.description == "List things."
+    assert registered.parameters["required"] == ["request"]
+    assert set(registered.parameters["properties"]) == {"request", "page"}
@@ -0,0 +1,67 @@
+"""Tests for the logging utilities."""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from telnyx_mcp_server.utils import logger as logger_module
+from telnyx_mcp_server.utils.logger import get_logger
+
+
+@pytest.fixture
+def batches():
+    """Record the messages of each batch the console handler writes."""
+    console_handler = logger_module._console_handler
+    console_handler.flush()
+    emit_batch = console_handler.target.emit_batch
+    batches = []
+
+    def record_batch(records):
+        # The handler clears its buffer after writing, so copy it now
+        batches.append([record.getMessage() for record in records])
+        emit_batch(records)
+
+    # Holding the handler lock keeps the periodic flush thread from
+    # writing a batch in the middle of a test
+    with (
+        console_handler.lock,
+        patch.object(
+            console_handler.target, "emit_batch", side_effect=record_batch
+        ),
+    ):
+        yield batches
+    console_handler.flush()
+
+
+def test_info_records_are_batched(batches):
+    """Test that INFO records are buffered and written in one batch."""
+    log = get_logger("telnyx_mcp_server.tests.batched")
+
+    log.info("first")
+    log.info("second")
+    assert batches == []
+
+    logger_module._console_handler.flush()
+
+    assert batches == [["first", "second"]]
+
+
+def test_warning_flushes_immediately(batches):
+    """Test that a WARNING record writes out the buffer at once."""
+    log = get_logger("telnyx_mcp_server.tests.warning")
+
+    log.info("buffered")
+    log.warning("urgent")
+
+    assert batches == [["buffered", "urgent"]]
+
+
+def test_records_propagate_to_root(caplog):
+    """Test that records still reach root handlers such as caplog."""
+    log = get_logger("telnyx_mcp_server.tests.propagate")
+
+    with caplog.at_level(logging.INFO):
+        log.info("visible")
+
+    assert "visible" in caplog.messages
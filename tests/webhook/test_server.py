@@ -1,25 +1,36 @@
 """Tests for the webhook server."""
 
 import json
+import os
+import tempfile
 from unittest.mock import patch
 
-from fastapi.testclient import TestClient
+import httpx
 import pytest
 
 from telnyx_mcp_server.config import settings
-from telnyx_mcp_server.webhook.server import webhook_app
+from telnyx_mcp_server.webhook.server import (
+    HISTORY_PREVIEW_SIZE,
+    HISTORY_SCAN_SIZE,
+    UnixSocketHandler,
+    UnixSocketHTTPServer,
+    _scan_head,
+    webhook_history,
+)
 
+# Keep these tests on one xdist worker (with --dist=loadgroup) so they
+# share the module-scoped socket server
+pytestmark = pytest.mark.xdist_group("webhook")
 
-@pytest.fixture
-def client():
-    """Create a test client for the webhook server."""
-    return TestClient(webhook_app)
+_WEBHOOK_PATH = settings.webhook_path
 
+# Body size limit of the test server, kept small so an oversized request
+# fits in the socket buffers
+_MAX_BODY = 4096
 
-def test_webhook_handler_valid_payload(client):
-    """Test that the webhook handler accepts valid payloads."""
-    # Sample Telnyx webhook payload
-    payload = {
+# Sample Telnyx webhook payloads, serialized once
+_VALID_PAYLOAD = json.dumps(
+    {
         "data": {
             "event_type": "call.initiated",
             "id": "0ccc7b54-4df3-4bca-a65a-3da1ecc777f0",
@@ -39,90 +50,215 @@ def test_webhook_handler_valid_payload(client):
             "delivered_to": "https://example.com/webhooks",
         },
     }
+).encode()
+_EVENT_PAYLOAD = json.dumps(
+    {
+        "data": {
+            "event_type": "call.initiated",
+            "id": "0ccc7b54-4df3-4bca-a65a-3da1ecc777f0",
+        },
+    }
+).encode()
+
+# Serialized once: just over the size limit, so the server must reject it
+_LARGE_BODY = b'{"data": "' + b"x" * (_MAX_BODY + 1) + b'"}'
+
+_JSON_HEADERS = {"content-type": "application/json"}
 
-    # Mock headers
+
+@pytest.fixture(scope="module")
+def server():
+    """Run a webhook server on a temporary Unix socket for the module."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "webhook.sock")
+        server = UnixSocketHTTPServer(path, UnixSocketHandler)
+        server.max_body_size = _MAX_BODY
+        server.start()
+        yield server
+        server.stop()
+
+
+@pytest.fixture(scope="module")
+def client(server):
+    """Create an HTTP client that talks to the server over its socket."""
+    transport = httpx.HTTPTransport(uds=server.server_address)
+    with httpx.Client(
+        transport=transport, base_url="http://webhook"
+    ) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _clear_history():
+    """Start every test with an empty webhook history."""
+    webhook_history.clear()
+    yield
+    webhook_history.clear()
+
+
+def test_webhook_handler_valid_payload(client):
+    """Test that the webhook handler accepts and records valid payloads."""
     headers = {
         "telnyx-signature-ed25519": "test-signature",
         "telnyx-timestamp": "1609459200",
+        **_JSON_HEADERS,
     }
 
     # Send the request
     response = client.post(
-        settings.webhook_path,
-        json=payload,
+        _WEBHOOK_PATH,
+        content=_VALID_PAYLOAD,
         headers=headers,
     )
 
     # Check the response
     assert response.status_code == 200
+    assert response.json()["status"] == "success"
+
+    # Check the history entry
+    (entry,) = webhook_history
+    assert entry["event_type"] == "call.initiated"
+    assert entry["payload"] == json.loads(_VALID_PAYLOAD)
+    assert entry["headers"]["Telnyx-Timestamp"] == "1609459200"
 
 
 def test_webhook_handler_empty_payload(client):
     """Test that the webhook handler accepts empty payloads."""
     # Send the request with an empty body
-    response = client.post(settings.webhook_path)
+    response = client.post(_WEBHOOK_PATH)
 
     # Check the response
     assert response.status_code == 200
+    assert not webhook_history
 
 
 def test_webhook_handler_invalid_json(client):
-    """Test that the webhook handler rejects invalid JSON."""
+    """Test that invalid JSON is acknowledged but not recorded."""
     # Send the request with invalid JSON
     response = client.post(
-        settings.webhook_path,
+        _WEBHOOK_PATH,
         content=b"{invalid json",
     )
 
     # Check the response
-    assert response.status_code == 400
-    assert "Invalid JSON payload" in response.json()["detail"]
+    assert response.status_code == 200
+    assert not webhook_history
 
 
 def test_webhook_handler_payload_too_large(client):
     """Test that the webhook handler rejects payloads that are too large."""
-    # Create a large payload
-    large_payload = {"data": "x" * (settings.webhook_max_body_size + 1)}
-
-    # Mock the content-length header
-    headers = {
-        "content-length": str(len(json.dumps(large_payload))),
-    }
-
     # Send the request
     response = client.post(
-        settings.webhook_path,
-        json=large_payload,
-        headers=headers,
+        _WEBHOOK_PATH,
+        content=_LARGE_BODY,
+        headers=_JSON_HEADERS,
     )
 
     # Check the response
     assert response.status_code == 413
-    assert "Request body too large" in response.json()["detail"]
+    assert response.json()["message"] == "Request entity too large"
+    assert not webhook_history
 
 
 @patch("telnyx_mcp_server.webhook.server.logger")
 def test_webhook_handler_logs_payload(mock_logger, client):
     """Test that the webhook handler logs the payload."""
-    # Sample Telnyx webhook payload
-    payload = {
-        "data": {
-            "event_type": "call.initiated",
-            "id": "0ccc7b54-4df3-4bca-a65a-3da1ecc777f0",
-        },
-    }
-
     # Send the request
     response = client.post(
-        settings.webhook_path,
-        json=payload,
+        _WEBHOOK_PATH,
+        content=_EVENT_PAYLOAD,
+        headers=_JSON_HEADERS,
     )
 
     # Check that the logger was called
-    mock_logger.debug.assert_called()
-    mock_logger.info.assert_called_with(
-        "Received webhook event: call.initiated"
+    mock_logger.info.assert_any_call(
+        "Received webhook event: %s", "call.initiated"
     )
 
     # Check the response
     assert response.status_code == 200
+
+
+def test_health_check(client):
+    """Test that GET requests return a health check response."""
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ok"
+    assert body["path"] == "/health"
+
+
+def test_scan_head_first_match_wins():
+    """Test that the first occurrence of each field is kept."""
+    body = bytearray(
+        b'{"data": {"event_type": "message.received", "id": "event-id",'
+        b' "payload": {"id": "message-id", "occurred_at": "later"}},'
+        b' "occurred_at": "2025-01-01T00:00:00Z"}'
+    )
+
+    assert _scan_head(body) == {
+        "event_type": "message.received",
+        "id": "event-id",
+        "occurred_at": "later",
+    }
+
+
+def test_scan_head_ignores_escaped_quotes():
+    """Test that field names inside string values are not matched."""
+    body = bytearray(
+        json.dumps(
+            {
+                "text": 'say "id": "fake" and "event_type": "fake"',
+                "id": "real-id",
+            }
+        ).encode()
+    )
+
+    assert _scan_head(body) == {"id": "real-id"}
+
+
+def test_scan_head_only_scans_the_head():
+    """Test that fields past the scanned prefix are not found."""
+    body = bytearray(
+        b'{"padding": "' + b"x" * HISTORY_SCAN_SIZE + b'", "id": "late"}'
+    )
+
+    assert _scan_head(body) == {}
+
+
+def test_oversized_payload_is_summarized(client, server, monkeypatch):
+    """Test the history entry recorded for a body over the history limit."""
+    monkeypatch.setattr(server, "history_max_payload_size", 64)
+
+    response = client.post(
+        _WEBHOOK_PATH, content=_VALID_PAYLOAD, headers=_JSON_HEADERS
+    )
+
+    assert response.status_code == 200
+    (entry,) = webhook_history
+    assert entry["event_type"] == "call.initiated"
+    assert "payload" not in entry
+    assert entry["payload_summary"] == {
+        "id": "0ccc7b54-4df3-4bca-a65a-3da1ecc777f0",
+        "occurred_at": "2023-01-01T00:00:00Z",
+        "payload_bytes": len(_VALID_PAYLOAD),
+        "payload_preview": _VALID_PAYLOAD[:HISTORY_PREVIEW_SIZE].decode(),
+    }
+
+
+def test_zero_history_limit_keeps_full_payload(client, server, monkeypatch):
+    """Test that a history limit of 0 keeps every payload in full."""
+    monkeypatch.setattr(server, "history_max_payload_size", 0)
+    payload = {"data": {"event_type": "message.received", "text": "x" * 3000}}
+
+    response = client.post(
+        _WEBHOOK_PATH,
+        content=json.dumps(payload).encode(),
+        headers=_JSON_HEADERS,
+    )
+
+    assert response.status_code == 200
+    (entry,) = webhook_history
+    assert entry["payload"] == payload
+    assert "payload_summary" not in entry